@@ -34,7 +34,7 @@ class CriticAgent(BaseAgent):
         super().__init__(agent_type="critic")
 
         # Quality thresholds from config
-        self.quality_threshold = getattr(self.config.project, 'quality_threshold', 7.0)
+        self.quality_threshold = self.config.project.quality_threshold
         self.min_acceptable_score = 5.0  # Below this triggers mandatory revision
         
     def get_system_prompt(self) -> str:
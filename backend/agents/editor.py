@@ -96,12 +96,14 @@ You are the first pass - focus purely on technical correctness."""
         Perform grammar editing pass.
         
         Args:
-            task_input: Contains content, chapter_number
+            task_input: Contains content, chapter_number, optional word_count
             
         Returns:
             Grammar-corrected content with tracked changes
         """
         content = task_input.get("content", "")
+        # Callers that already counted the words pass them in to skip a re-split
+        word_count = task_input.get("word_count") or len(content.split())
         chapter_number = task_input.get("chapter_number", 0)
 
         messages = [
@@ -131,7 +133,7 @@ Make ONLY grammatical corrections. Do not change style or voice.""",
             },
         ]
 
-        response = await self.chat(messages, max_tokens=int(len(content.split()) * 1.5))
+        response = await self.chat(messages, max_tokens=int(word_count * 1.5))
 
         try:
             # Try to parse JSON response
@@ -190,12 +192,14 @@ You are the second pass - focus on making good prose great."""
         Perform style editing pass.
         
         Args:
-            task_input: Contains content, style_guide, reference_examples
+            task_input: Contains content, style_guide, reference_examples, optional word_count
             
         Returns:
             Style-improved content with tracked changes
         """
         content = task_input.get("content", "")
+        # Callers that already counted the words pass them in to skip a re-split
+        word_count = task_input.get("word_count") or len(content.split())
         style_guide = task_input.get("style_guide", "")
         reference_examples = task_input.get("reference_examples", "")
         chapter_number = task_input.get("chapter_number", 0)
@@ -231,7 +235,7 @@ Improve prose quality while preserving voice.""",
             },
         ]
 
-        response = await self.chat(messages, max_tokens=int(len(content.split()) * 1.5))
+        response = await self.chat(messages, max_tokens=int(word_count * 1.5))
 
         try:
             result = json.loads(response)
@@ -288,12 +292,14 @@ You are the third pass - ensure the story holds together logically."""
         Perform continuity editing pass.
         
         Args:
-            task_input: Contains content, story_bible, previous_chapters_summary
+            task_input: Contains content, story_bible, previous_chapters_summary, optional word_count
             
         Returns:
             Continuity-checked content with issues flagged
         """
         content = task_input.get("content", "")
+        # Callers that already counted the words pass them in to skip a re-split
+        word_count = task_input.get("word_count") or len(content.split())
         story_bible = task_input.get("story_bible", {})
         previous_chapters = task_input.get("previous_chapters_summary", "")
         chapter_number = task_input.get("chapter_number", 0)
@@ -344,7 +350,7 @@ Fix minor issues, flag major ones for review.""",
             },
         ]
 
-        response = await self.chat(messages, max_tokens=int(len(content.split()) * 1.5))
+        response = await self.chat(messages, max_tokens=int(word_count * 1.5))
 
         try:
             result = json.loads(response)
@@ -36,16 +36,8 @@ class SummarizerAgent(BaseAgent):
         super().__init__(agent_type="summarizer")
 
         # Compression settings from config
-        try:
-            summarizer_config = getattr(self.config.agents, 'summarizer')
-            self.compression_ratio = getattr(summarizer_config, 'compression_ratio', 10)
-        except Exception:
-            self.compression_ratio = 10
-
-        try:
-            self.context_threshold = getattr(self.config.memory, 'context_window_threshold', 0.8)
-        except Exception:
-            self.context_threshold = 0.8
+        self.compression_ratio = self.config.agents.summarizer.compression_ratio
+        self.context_threshold = self.config.memory.context_window_threshold
         
     def get_system_prompt(self) -> str:
         """Get the system prompt for the summarizer agent."""
@@ -6,14 +6,15 @@ from fastapi import APIRouter, HTTPException, status
 from typing import List, Dict, Any
 
 from backend.api.models import ErrorResponse
-from backend.memory.database import Database
+from backend.memory.database import Database, get_database
+from backend.utils.config import get_config
 
 router = APIRouter(prefix="/api/projects/{project_id}/chapters", tags=["chapters"])
 
 
 def get_db() -> Database:
-    """Get database instance."""
-    return Database()
+    """Get the shared database instance."""
+    return get_database(get_config().database.path)
 
 
 @router.get(
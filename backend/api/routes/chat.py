@@ -10,7 +10,7 @@ import uuid
 import logging
 
 from backend.agents.director import DirectorAgent
-from backend.memory.database import Database
+from backend.memory.database import Database, get_database
 from backend.utils.config import get_config
 
 router = APIRouter(prefix="/api/projects", tags=["chat"])
@@ -55,8 +55,8 @@ class StoredChatMessage(BaseModel):
 
 
 def get_db() -> Database:
-    """Get database instance."""
-    return Database()
+    """Get the shared database instance."""
+    return get_database(get_config().database.path)
 
 
 async def get_director() -> DirectorAgent:
@@ -135,7 +135,7 @@ async def chat_with_director(project_id: str, request: ChatRequest):
     
     try:
         # Save user message to database
-        user_msg_id = str(uuid.uuid4())
+        user_msg_id = uuid.uuid4().hex
         db.save_chat_message(
             message_id=user_msg_id,
             project_id=project_id,
@@ -152,7 +152,7 @@ async def chat_with_director(project_id: str, request: ChatRequest):
         )
         
         # Save assistant response to database
-        assistant_msg_id = str(uuid.uuid4())
+        assistant_msg_id = uuid.uuid4().hex
         db.save_chat_message(
             message_id=assistant_msg_id,
             project_id=project_id,
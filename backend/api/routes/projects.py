@@ -12,14 +12,15 @@ from backend.api.models import (
     ProjectResponse,
     ErrorResponse,
 )
-from backend.memory.database import Database
+from backend.memory.database import Database, get_database
+from backend.utils.config import get_config
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
 
 def get_db() -> Database:
-    """Get database instance."""
-    return Database()
+    """Get the shared database instance."""
+    return get_database(get_config().database.path)
 
 
 @router.post(
@@ -39,7 +40,7 @@ async def create_project(project_data: ProjectCreate):
         Created project details
     """
     db = get_db()
-    project_id = str(uuid.uuid4())
+    project_id = uuid.uuid4().hex
     
     try:
         project = db.create_project(
@@ -4,9 +4,12 @@ WebSocket support for real-time updates in ScribeNet.
 
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import Dict, Set
-import json
+import logging
+import orjson
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
@@ -40,7 +43,7 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific client."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode())
         except Exception:
             pass
     
@@ -49,7 +52,7 @@ class ConnectionManager:
         if project_id not in self.active_connections:
             return
         
-        message_str = json.dumps(message)
+        message_str = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
         dead_connections = set()
         
         for connection in self.active_connections[project_id]:
@@ -64,7 +67,7 @@ class ConnectionManager:
     
     async def broadcast_global(self, message: dict):
         """Send a message to all global connections."""
-        message_str = json.dumps(message)
+        message_str = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
         dead_connections = set()
         
         for connection in self.global_connections:
@@ -144,7 +147,7 @@ async def project_websocket_endpoint(websocket: WebSocket, project_id: str):
     except WebSocketDisconnect:
         manager.disconnect(websocket, project_id)
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket, project_id)
 
 
@@ -183,5 +186,5 @@ async def global_websocket_endpoint(websocket: WebSocket):
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
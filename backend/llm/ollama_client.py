@@ -6,14 +6,17 @@ Supports both streaming and non-streaming generation with context management.
 """
 
 import asyncio
+import logging
+import time
 import aiohttp
+import orjson
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
 
-# A very small, local print-based tracing strategy is used per user request
+logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaResponse:
     """Response from Ollama API"""
     text: str
@@ -42,6 +45,7 @@ class OllamaClient:
         base_url: str = "http://localhost:11434",
         timeout: int = 120,
         max_retries: int = 3,
+        health_ttl: float = 30.0,
     ):
         """
         Initialize Ollama client
@@ -50,11 +54,25 @@ class OllamaClient:
             base_url: Base URL for Ollama server (default: http://localhost:11434)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            health_ttl: Seconds a successful response counts as a passed health check
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
+        self.health_ttl = health_ttl
         self._session: Optional[aiohttp.ClientSession] = None
+        # Monotonic time of the last successful response from the server
+        self._last_ok: Optional[float] = None
+    
+    @property
+    def retry_budget(self) -> float:
+        """Worst-case seconds a request can take across all attempts and backoff sleeps."""
+        backoff = sum(2 ** attempt for attempt in range(self.max_retries - 1))
+        return self.timeout.total * self.max_retries + backoff
+    
+    def _mark_ok(self):
+        """Record that the server just answered successfully."""
+        self._last_ok = time.monotonic()
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
@@ -76,19 +94,30 @@ class OllamaClient:
         await self.close()
     
     async def health_check(self) -> bool:
+        """
+        Check that the Ollama server is reachable.
+        
+        Skips the request if the server answered successfully within
+        health_ttl seconds; a server that has since died is reported by the
+        next real request instead.
+        """
+        if self._last_ok is not None and time.monotonic() - self._last_ok < self.health_ttl:
+            return True
+        
         try:
             session = await self._get_session()
             async with session.get(f"{self.base_url}/api/tags") as response:
                 if response.status == 200:
                     data = await response.json()
                     models = [model.get("name") for model in data.get("models", [])]
-                    print(f"Ollama server healthy. Available models: {models}")
+                    logger.info(f"Ollama server healthy. Available models: {models}")
+                    self._mark_ok()
                     return True
                 else:
-                    print(f"Ollama health check failed: {response.status}")
+                    logger.error(f"Ollama health check failed: {response.status}")
                     return False
         except Exception as e:
-            print(f"Ollama health check error: {e}")
+            logger.error(f"Ollama health check error: {e}")
             return False
 
     
@@ -159,6 +188,7 @@ class OllamaClient:
                     json=payload
                 ) as response:
                     if response.status == 200:
+                        self._mark_ok()
                         data = await response.json()
                         return OllamaResponse(
                             text=data.get("response", ""),
@@ -171,14 +201,14 @@ class OllamaClient:
                         )
                     else:
                         error_text = await response.text()
-                        print(f"Ollama generate failed: {response.status} - {error_text}")
+                        logger.error(f"Ollama generate failed: {response.status} - {error_text}")
                         if attempt < self.max_retries - 1:
                             await asyncio.sleep(2 ** attempt)  # Exponential backoff
                         else:
                             raise Exception(f"Ollama generate failed after {self.max_retries} attempts")
 
             except aiohttp.ClientError as e:
-                print(f"Ollama client error (attempt {attempt + 1}/{self.max_retries}): {e}")
+                logger.warning(f"Ollama client error (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 else:
@@ -190,11 +220,11 @@ class OllamaClient:
         Ollama returns JSON lines with response text chunks. We parse each line,
         extract the token/text, and pass it to the callback for live display.
         """
-        import json
-        
         session = await self._get_session()
         model = payload.get("model")
-        full_text = ""
+        # Collect tokens and join once at the end instead of re-copying the
+        # growing text on every token
+        parts: List[str] = []
 
         try:
             # Set stream to true for Ollama
@@ -203,26 +233,23 @@ class OllamaClient:
             async with session.post(f"{self.base_url}/api/generate", json=payload) as resp:
                 if resp.status != 200:
                     txt = await resp.text()
-                    print(f"Ollama stream start failed: {resp.status} - {txt}")
+                    logger.error(f"Ollama stream start failed: {resp.status} - {txt}")
                     raise Exception("Ollama stream failed to start")
+                self._mark_ok()
 
                 # Read response line by line (Ollama sends newline-delimited JSON)
                 async for line_bytes in resp.content:
-                    try:
-                        line = line_bytes.decode('utf-8').strip()
-                    except Exception:
-                        continue
-                    
+                    line = line_bytes.strip()
                     if not line:
                         continue
                     
                     try:
-                        # Parse JSON response from Ollama
-                        data = json.loads(line)
+                        # Parse JSON response from Ollama (orjson takes the raw bytes)
+                        data = orjson.loads(line)
                         token = data.get("response", "")
                         
                         if token:
-                            full_text += token
+                            parts.append(token)
                             
                             # Send token to callback for live display
                             if _token_callback:
@@ -231,21 +258,21 @@ class OllamaClient:
                                 except Exception:
                                     pass
                                     
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
         except Exception as e:
-            print(f"Ollama streaming error: {e}")
+            logger.error(f"Ollama streaming error: {e}")
 
-        return OllamaResponse(text=full_text, model=model or payload.get('model', ''), done=True)
+        return OllamaResponse(text="".join(parts), model=model or payload.get('model', ''), done=True)
     
     async def _chat_stream(self, payload: Dict[str, Any]) -> OllamaResponse:
         """Stream chat completion from Ollama."""
-        import json
-        
         session = await self._get_session()
         model = payload.get("model")
-        full_text = ""
+        # Collect tokens and join once at the end instead of re-copying the
+        # growing text on every token
+        parts: List[str] = []
 
         try:
             # Set stream to true for Ollama
@@ -254,27 +281,24 @@ class OllamaClient:
             async with session.post(f"{self.base_url}/api/chat", json=payload) as resp:
                 if resp.status != 200:
                     txt = await resp.text()
-                    print(f"Ollama chat stream failed: {resp.status} - {txt}")
+                    logger.error(f"Ollama chat stream failed: {resp.status} - {txt}")
                     raise Exception("Ollama chat stream failed to start")
+                self._mark_ok()
 
                 # Read response line by line (Ollama sends newline-delimited JSON)
                 async for line_bytes in resp.content:
-                    try:
-                        line = line_bytes.decode('utf-8').strip()
-                    except Exception:
-                        continue
-                    
+                    line = line_bytes.strip()
                     if not line:
                         continue
                     
                     try:
-                        # Parse JSON response from Ollama
-                        data = json.loads(line)
+                        # Parse JSON response from Ollama (orjson takes the raw bytes)
+                        data = orjson.loads(line)
                         message = data.get("message", {})
                         token = message.get("content", "")
                         
                         if token:
-                            full_text += token
+                            parts.append(token)
                             
                             # Send token to callback for live display
                             if _token_callback:
@@ -283,13 +307,13 @@ class OllamaClient:
                                 except Exception:
                                     pass
                                     
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
         except Exception as e:
-            print(f"Ollama chat streaming error: {e}")
+            logger.error(f"Ollama chat streaming error: {e}")
 
-        return OllamaResponse(text=full_text, model=model or payload.get('model', ''), done=True)
+        return OllamaResponse(text="".join(parts), model=model or payload.get('model', ''), done=True)
     
     async def chat_completion(
         self,
@@ -355,6 +379,7 @@ class OllamaClient:
                     json=payload
                 ) as response:
                     if response.status == 200:
+                        self._mark_ok()
                         data = await response.json()
                         # Extract message content
                         message = data.get("message", {})
@@ -373,14 +398,14 @@ class OllamaClient:
                         )
                     else:
                         error_text = await response.text()
-                        print(f"Ollama chat failed: {response.status} - {error_text}")
+                        logger.error(f"Ollama chat failed: {response.status} - {error_text}")
                         if attempt < self.max_retries - 1:
                             await asyncio.sleep(2 ** attempt)  # Exponential backoff
                         else:
                             raise Exception(f"Ollama chat failed after {self.max_retries} attempts")
 
             except aiohttp.ClientError as e:
-                print(f"Ollama client error (attempt {attempt + 1}/{self.max_retries}): {e}")
+                logger.warning(f"Ollama client error (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 else:
@@ -400,10 +425,10 @@ class OllamaClient:
                     data = await response.json()
                     return data.get("models", [])
                 else:
-                    print(f"Failed to list models: {response.status}")
+                    logger.error(f"Failed to list models: {response.status}")
                     return []
         except Exception as e:
-            print(f"Error listing models: {e}")
+            logger.error(f"Error listing models: {e}")
             return []
 
 
@@ -16,7 +16,7 @@ for clean separation of concerns.
 """
 
 import asyncio
-import sys
+import signal
 import logging
 from typing import Any
 
@@ -32,9 +32,12 @@ from backend.mcp.tools import (
     StoryBibleTools,
     SearchTools,
 )
+from backend.llm.ollama_client import close_ollama_client
+from backend.utils import background
+from backend.utils.log import setup_logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+# Setup logging (stdout carries the MCP protocol, so logs go to stderr)
+setup_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create MCP server
@@ -119,13 +122,40 @@ async def main():
     """Run the MCP server."""
     logger.info("Starting ScribeNet Core MCP Server...")
     
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
+    # Stop serving on SIGTERM so queued background jobs can finish
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+    except NotImplementedError:
+        # Windows event loops have no add_signal_handler
+        signal.signal(signal.SIGTERM, lambda *_: loop.call_soon_threadsafe(main_task.cancel))
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    except asyncio.CancelledError:
+        logger.info("Server cancelled, shutting down...")
+    finally:
+        # Independent teardown steps; a failure in one must not skip the other
+        results = await asyncio.gather(
+            background.drain(), close_ollama_client(), return_exceptions=True
         )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during shutdown: {result}")
 
 
 if __name__ == "__main__":
+    try:
+        # libuv-based loop: cheaper callback scheduling for the token stream.
+        # Installed with uvicorn[standard]; not available on Windows.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -2,8 +2,10 @@
 Base class for MCP tools.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List
 from mcp.types import Tool, TextContent
 import logging
 
@@ -20,6 +22,9 @@ class BaseTool(ABC):
     3. Handle errors gracefully
     """
     
+    _SUCCESS_PREFIX = "✅ "
+    _ERROR_PREFIX = "❌ "
+    
     def __init__(self):
         """Initialize the tool."""
         self.logger = logger
@@ -52,13 +57,25 @@ class BaseTool(ABC):
         """
         pass
     
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call (e.g. a SQLite write) in the default thread pool
+        so it doesn't stall the event loop while other tools are streaming.
+        
+        Uses run_in_executor directly rather than asyncio.to_thread: the
+        tools don't rely on context variables, so there is no need to copy
+        the context for every call.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+    
     def format_success(self, message: str) -> List[TextContent]:
         """Helper to format success response."""
-        return [TextContent(type="text", text=f"✅ {message}")]
+        return [TextContent(type="text", text=self._SUCCESS_PREFIX + message)]
     
     def format_error(self, message: str) -> List[TextContent]:
         """Helper to format error response."""
-        return [TextContent(type="text", text=f"❌ {message}")]
+        return [TextContent(type="text", text=self._ERROR_PREFIX + message)]
     
     def format_info(self, message: str) -> List[TextContent]:
         """Helper to format informational response."""
@@ -2,86 +2,100 @@
 Chapter management tools for MCP.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool, TextContent
 
 from backend.mcp.tools.base import BaseTool
-from backend.memory.database import Database
-from backend.memory.vector_store import VectorStore
+from backend.memory.database import get_database
+from backend.memory.git_manager import GitManager
+from backend.memory.vector_store import get_vector_store
 from backend.agents.writer import NarrativeWriterAgent
+from backend.llm.ollama_client import get_ollama_client
+from backend.utils import background
 from backend.utils.config import get_config
 
 
 class ChapterTools(BaseTool):
     """Tools for chapter operations (list, get, write)."""
     
+    _TOOLS: Tuple[Tool, ...] = (
+        Tool(
+            name="list_chapters",
+            description="List all chapters in a project with their status and word counts",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The unique identifier of the project"
+                    }
+                },
+                "required": ["project_id"]
+            }
+        ),
+        Tool(
+            name="get_chapter_content",
+            description="Get the full content and metadata of a specific chapter",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The unique identifier of the project"
+                    },
+                    "chapter_number": {
+                        "type": "integer",
+                        "description": "The chapter number to retrieve"
+                    }
+                },
+                "required": ["project_id", "chapter_number"]
+            }
+        ),
+        Tool(
+            name="write_chapter",
+            description="Write a complete chapter draft using the narrative writer agent. This creates the initial prose.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The project ID"
+                    },
+                    "chapter_number": {
+                        "type": "integer",
+                        "description": "The chapter number to write"
+                    },
+                    "additional_guidance": {
+                        "type": "string",
+                        "description": "Optional: Additional instructions or focus areas for this chapter"
+                    }
+                },
+                "required": ["project_id", "chapter_number"]
+            }
+        ),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.db = Database()
         self.config = get_config()
-        self.vector_store = VectorStore(
-            persist_directory=self.config.chroma.persist_directory
+        self.db = get_database(self.config.database.path)
+        self.vector_store = get_vector_store(self.config.chroma.persist_directory)
+        self.recent_chapters_in_context = self.config.project.recent_chapters_in_context
+        # Long enough for the client's own retries to run out first
+        self.llm_timeout = get_ollama_client().retry_budget
+        self.commit_chapters = (
+            self.config.git.auto_commit and "chapter_complete" in self.config.git.commit_on
         )
+        # GitManager creates the projects directory, so only build it when used
+        self.git: Optional[GitManager] = None
+        if self.commit_chapters:
+            self.git = GitManager(self.config.git.projects_path)
         self.writer = NarrativeWriterAgent()
     
     def get_tools(self) -> List[Tool]:
         """Return chapter management tool definitions."""
-        return [
-            Tool(
-                name="list_chapters",
-                description="List all chapters in a project with their status and word counts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the project"
-                        }
-                    },
-                    "required": ["project_id"]
-                }
-            ),
-            Tool(
-                name="get_chapter_content",
-                description="Get the full content and metadata of a specific chapter",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the project"
-                        },
-                        "chapter_number": {
-                            "type": "integer",
-                            "description": "The chapter number to retrieve"
-                        }
-                    },
-                    "required": ["project_id", "chapter_number"]
-                }
-            ),
-            Tool(
-                name="write_chapter",
-                description="Write a complete chapter draft using the narrative writer agent. This creates the initial prose.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The project ID"
-                        },
-                        "chapter_number": {
-                            "type": "integer",
-                            "description": "The chapter number to write"
-                        },
-                        "additional_guidance": {
-                            "type": "string",
-                            "description": "Optional: Additional instructions or focus areas for this chapter"
-                        }
-                    },
-                    "required": ["project_id", "chapter_number"]
-                }
-            ),
-        ]
+        return list(self._TOOLS)
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute a chapter management tool."""
@@ -169,9 +183,14 @@ class ChapterTools(BaseTool):
         self.logger.info(f"Writing chapter {chapter_number} for project: {project['title']}")
         
         # Get recent chapters for context
-        previous_chapters = self.db.list_chapters(project_id)  # Fixed: use list_chapters
-        previous_chapters = [c for c in previous_chapters if c['chapter_number'] < chapter_number]
+        all_chapters = self.db.list_chapters(project_id)  # Fixed: use list_chapters
+        previous_chapters = [c for c in all_chapters if c['chapter_number'] < chapter_number]
+        # A retry or rewrite reuses the chapter's row instead of colliding on
+        # its number after the LLM call has already been paid for
+        existing = next((c for c in all_chapters if c['chapter_number'] == chapter_number), None)
         previous_chapters.sort(key=lambda x: x['chapter_number'])
+        keep = self.recent_chapters_in_context
+        recent_chapters = previous_chapters[-keep:] if keep else []
         
         # Build context
         context_parts = []
@@ -184,7 +203,7 @@ class ChapterTools(BaseTool):
             search_query += f" {additional_guidance}"
         
         try:
-            semantic_context = self.vector_store.search_chapters(
+            semantic_context = await self.vector_store.asearch_chapters(
                 query=search_query,
                 project_id=project_id,
                 n_results=3  # Fixed: use n_results parameter
@@ -198,62 +217,91 @@ class ChapterTools(BaseTool):
         
         context = "\n".join(context_parts)
         
-        # Use NarrativeWriter to write the chapter
-        write_result = await self.writer.execute({
-            "project_id": project_id,
-            "chapter_number": chapter_number,
-            "outline": project['outline'],
-            "context": context,
-            "previous_chapters": previous_chapters[-2:] if previous_chapters else [],
-            "additional_guidance": additional_guidance,
-        })
+        # Use NarrativeWriter to write the chapter; a hung LLM call must not
+        # block the tool indefinitely
+        try:
+            write_result = await asyncio.wait_for(self.writer.execute({
+                "project_id": project_id,
+                "chapter_number": chapter_number,
+                "outline": project['outline'],
+                "context": context,
+                "previous_chapters": recent_chapters,
+                "additional_guidance": additional_guidance,
+            }), timeout=self.llm_timeout)
+        except asyncio.TimeoutError:
+            return self.format_error(
+                f"Writing chapter {chapter_number} timed out after {self.llm_timeout}s."
+            )
         
         chapter_content = write_result['content']
-        word_count = len(chapter_content.split())
+        # The writer already counted the words; only recount if it didn't
+        word_count = write_result.get('word_count') or len(chapter_content.split())
         
         # Generate IDs
         import uuid
-        chapter_id = f"chapter-{uuid.uuid4()}"
-        version_id = f"version-{uuid.uuid4()}"
+        chapter_id = existing['id'] if existing else f"chapter-{uuid.uuid4().hex}"
+        version_id = f"version-{uuid.uuid4().hex}"
         
-        # Save chapter to database (metadata only)
-        self.db.create_chapter(
-            chapter_id=chapter_id,
-            project_id=project_id,
-            chapter_number=chapter_number,
-            title=f"Chapter {chapter_number}",
-            outline=None
-        )
+        def save_chapter():
+            # Save chapter, metadata and new version in one transaction
+            with self.db.transaction():
+                version = 1
+                if existing:
+                    version = self.db.get_latest_version_number(chapter_id) + 1
+                else:
+                    self.db.create_chapter(
+                        chapter_id=chapter_id,
+                        project_id=project_id,
+                        chapter_number=chapter_number,
+                        title=f"Chapter {chapter_number}",
+                        outline=None
+                    )
+                
+                # Update chapter with word_count and status
+                self.db.update_chapter(
+                    chapter_id=chapter_id,
+                    word_count=word_count,
+                    status="draft",
+                    version=version
+                )
+                
+                # Save content as the next version
+                self.db.save_chapter_version(
+                    version_id=version_id,
+                    chapter_id=chapter_id,
+                    version=version,
+                    content=chapter_content,
+                    created_by="system",
+                    agent_name="NarrativeWriter",
+                    metadata={"additional_guidance": additional_guidance}
+                )
         
-        # Update chapter with word_count and status
-        self.db.update_chapter(
-            chapter_id=chapter_id,
-            word_count=word_count,
-            status="draft"
-        )
-        
-        # Save content as first version
-        self.db.save_chapter_version(
-            version_id=version_id,
-            chapter_id=chapter_id,
-            version=1,
-            content=chapter_content,
-            created_by="system",
-            agent_name="NarrativeWriter",
-            metadata={"additional_guidance": additional_guidance}
-        )
+        # Index only once the save has committed, so a rolled-back write never
+        # leaves its text in the vector store
+        await self.run_blocking(save_chapter)
         
-        # Add to vector store
         try:
-            self.vector_store.add_chapter(
+            await self.vector_store.aadd_chapter(
+                chapter_id=chapter_id,
                 project_id=project_id,
                 chapter_number=chapter_number,
+                title=f"Chapter {chapter_number}",
                 content=chapter_content,
                 metadata={"status": "draft", "word_count": word_count}
             )
         except Exception as e:
             self.logger.warning(f"Could not add to vector store: {e}")
         
+        # Commit to the project repository without holding up the response
+        if self.commit_chapters:
+            background.submit(
+                self.git.save_chapter,
+                project_id=project_id,
+                chapter_number=chapter_number,
+                title=f"Chapter {chapter_number}",
+                content=chapter_content
+            )
+        
         result = f"Wrote Chapter {chapter_number}\n\n"
         result += f"Word Count: {word_count}\n"
         result += f"Status: draft\n\n"
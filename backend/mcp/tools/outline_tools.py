@@ -2,46 +2,61 @@
 Outline generation tools for MCP.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool, TextContent
 
 from backend.mcp.tools.base import BaseTool
-from backend.memory.database import Database
+from backend.memory.database import get_database
+from backend.memory.git_manager import GitManager
 from backend.agents.director import DirectorAgent
 from backend.agents.outline import OutlineAgent
+from backend.llm.ollama_client import get_ollama_client
+from backend.utils import background
+from backend.utils.config import get_config
 
 
 class OutlineTools(BaseTool):
     """Tools for generating and managing outlines."""
     
+    _TOOLS: Tuple[Tool, ...] = (
+        Tool(
+            name="generate_outline",
+            description="Generate a detailed chapter-by-chapter outline for a book project. Creates the story structure and vision.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The project ID to generate outline for"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "Additional guidance or requirements for the outline"
+                    }
+                },
+                "required": ["project_id"]
+            }
+        ),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.db = Database()
+        self.config = get_config()
+        self.db = get_database(self.config.database.path)
+        self.llm_timeout = get_ollama_client().retry_budget
+        self.commit_outlines = (
+            self.config.git.auto_commit and "outline_update" in self.config.git.commit_on
+        )
+        self.git: Optional[GitManager] = None
+        if self.commit_outlines:
+            self.git = GitManager(self.config.git.projects_path)
         self.outline_agent = OutlineAgent()
         self.director = DirectorAgent()
     
     def get_tools(self) -> List[Tool]:
         """Return outline tool definitions."""
-        return [
-            Tool(
-                name="generate_outline",
-                description="Generate a detailed chapter-by-chapter outline for a book project. Creates the story structure and vision.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The project ID to generate outline for"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Additional guidance or requirements for the outline"
-                        }
-                    },
-                    "required": ["project_id"]
-                }
-            ),
-        ]
+        return list(self._TOOLS)
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute an outline tool."""
@@ -65,31 +80,47 @@ class OutlineTools(BaseTool):
         # Generate vision if not exists
         vision_document = project.get('vision_document')
         if not vision_document:
-            vision_result = await self.director.execute({
-                "task_type": "plan_project",
-                "title": project['title'],
-                "genre": project['genre'],
-                "description": project.get('description', '') + ' ' + additional_desc,
-                "target_chapters": project.get('target_chapters', 20),
-            })
+            try:
+                vision_result = await asyncio.wait_for(self.director.execute({
+                    "task_type": "plan_project",
+                    "title": project['title'],
+                    "genre": project['genre'],
+                    "description": project.get('description', '') + ' ' + additional_desc,
+                    "target_chapters": project.get('target_chapters', 20),
+                }), timeout=self.llm_timeout)
+            except asyncio.TimeoutError:
+                return self.format_error(f"Planning the project timed out after {self.llm_timeout}s.")
             vision_document = vision_result['vision_document']
             
             # Save vision
-            self.db.update_project(project_id, vision_document=vision_document)
+            await self.run_blocking(self.db.update_project, project_id, vision_document=vision_document)
         
         # Generate outline using OutlineAgent
-        outline_result = await self.outline_agent.execute({
-            "task_type": "create_outline",
-            "title": project['title'],
-            "genre": project['genre'],
-            "vision_document": vision_document,
-            "target_chapters": project.get('target_chapters', 20),
-        })
+        try:
+            outline_result = await asyncio.wait_for(self.outline_agent.execute({
+                "task_type": "create_outline",
+                "title": project['title'],
+                "genre": project['genre'],
+                "vision_document": vision_document,
+                "target_chapters": project.get('target_chapters', 20),
+            }), timeout=self.llm_timeout)
+        except asyncio.TimeoutError:
+            return self.format_error(f"Generating the outline timed out after {self.llm_timeout}s.")
         
         outline_content = outline_result['outline']
         
         # Save outline to database
-        self.db.update_project(project_id, outline=outline_content, status='outlined')
+        await self.run_blocking(
+            self.db.update_project, project_id, outline=outline_content, status='outlined'
+        )
+        
+        # Commit to the project repository without holding up the response
+        if self.commit_outlines:
+            background.submit(
+                self.git.save_outline,
+                project_id=project_id,
+                outline_content=outline_content
+            )
         
         result = f"Generated outline for: {project['title']}\n\n"
         result += f"Outline Preview:\n{outline_content[:800]}...\n\n"
@@ -2,79 +2,82 @@
 Project management tools for MCP.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from mcp.types import Tool, TextContent
 
 from backend.mcp.tools.base import BaseTool
-from backend.memory.database import Database
+from backend.memory.database import get_database
+from backend.utils.config import get_config
 
 
 class ProjectTools(BaseTool):
     """Tools for project management (create, list, get info)."""
     
+    _TOOLS: Tuple[Tool, ...] = (
+        Tool(
+            name="list_projects",
+            description="List all projects in the system",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of projects to return",
+                        "default": 10
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_project_info",
+            description="Get detailed information about a project by ID",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The unique identifier of the project"
+                    }
+                },
+                "required": ["project_id"]
+            }
+        ),
+        Tool(
+            name="create_project",
+            description="Create a new book writing project with title, genre, and description",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "title": {
+                        "type": "string",
+                        "description": "The title of the book"
+                    },
+                    "genre": {
+                        "type": "string",
+                        "description": "The genre (e.g., sci-fi, mystery, fantasy, romance)"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "A brief description of the book's concept"
+                    },
+                    "target_chapters": {
+                        "type": "integer",
+                        "description": "Number of chapters planned for the book",
+                        "default": 20
+                    }
+                },
+                "required": ["title", "genre"]
+            }
+        ),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.db = Database()
+        self.db = get_database(get_config().database.path)
     
     def get_tools(self) -> List[Tool]:
         """Return project management tool definitions."""
-        return [
-            Tool(
-                name="list_projects",
-                description="List all projects in the system",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of projects to return",
-                            "default": 10
-                        }
-                    }
-                }
-            ),
-            Tool(
-                name="get_project_info",
-                description="Get detailed information about a project by ID",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the project"
-                        }
-                    },
-                    "required": ["project_id"]
-                }
-            ),
-            Tool(
-                name="create_project",
-                description="Create a new book writing project with title, genre, and description",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "The title of the book"
-                        },
-                        "genre": {
-                            "type": "string",
-                            "description": "The genre (e.g., sci-fi, mystery, fantasy, romance)"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "A brief description of the book's concept"
-                        },
-                        "target_chapters": {
-                            "type": "integer",
-                            "description": "Number of chapters planned for the book",
-                            "default": 20
-                        }
-                    },
-                    "required": ["title", "genre"]
-                }
-            ),
-        ]
+        return list(self._TOOLS)
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute a project management tool."""
@@ -142,21 +145,26 @@ class ProjectTools(BaseTool):
         description = arguments.get("description", "")
         target_chapters = arguments.get("target_chapters", 20)
         
-        project_id = f"project-{uuid.uuid4()}"
+        project_id = f"project-{uuid.uuid4().hex}"
         
         # Note: Database doesn't have description field, we use vision_document
         # But we'll store description as initial vision_document
-        project = self.db.create_project(
-            project_id=project_id,
-            title=title,
-            genre=genre,
-            vision_document=description if description else None
-        )
-        
-        # Update target_chapters separately if needed
-        if target_chapters:
-            self.db.update_project(project_id, target_chapters=target_chapters)
-            project = self.db.get_project(project_id)
+        def save_project():
+            with self.db.transaction():
+                project = self.db.create_project(
+                    project_id=project_id,
+                    title=title,
+                    genre=genre,
+                    vision_document=description if description else None
+                )
+                
+                # Update target_chapters separately if needed
+                if target_chapters:
+                    self.db.update_project(project_id, target_chapters=target_chapters)
+                    project = self.db.get_project(project_id)
+                return project
+        
+        project = await self.run_blocking(save_project)
         
         result = f"✅ Created project: {project['title']}\n"
         result += f"ID: {project['id']}\n"
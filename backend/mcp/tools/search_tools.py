@@ -2,54 +2,56 @@
 Context search tools for MCP.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from mcp.types import Tool, TextContent
 
 from backend.mcp.tools.base import BaseTool
-from backend.memory.vector_store import VectorStore
+from backend.memory.vector_store import get_vector_store
 from backend.utils.config import get_config
 
 
 class SearchTools(BaseTool):
     """Tools for semantic search across chapters and story bible."""
     
+    _TOOLS: Tuple[Tool, ...] = (
+        Tool(
+            name="search_context",
+            description="Search for relevant context across all chapters and story bible using semantic search",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The project ID"
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "The search query"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results to return",
+                        "default": 5
+                    },
+                    "search_type": {
+                        "type": "string",
+                        "description": "What to search: chapters, story_bible, or both",
+                        "enum": ["chapters", "story_bible", "both"],
+                        "default": "both"
+                    }
+                },
+                "required": ["project_id", "query"]
+            }
+        ),
+    )
+    
     def __init__(self):
         super().__init__()
         self.config = get_config()
     
     def get_tools(self) -> List[Tool]:
         """Return search tool definitions."""
-        return [
-            Tool(
-                name="search_context",
-                description="Search for relevant context across all chapters and story bible using semantic search",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The project ID"
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "The search query"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results to return",
-                            "default": 5
-                        },
-                        "search_type": {
-                            "type": "string",
-                            "description": "What to search: chapters, story_bible, or both",
-                            "enum": ["chapters", "story_bible", "both"],
-                            "default": "both"
-                        }
-                    },
-                    "required": ["project_id", "query"]
-                }
-            ),
-        ]
+        return list(self._TOOLS)
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute a search tool."""
@@ -67,7 +69,7 @@ class SearchTools(BaseTool):
         search_type = arguments.get("search_type", "both")
         
         try:
-            vector_store = VectorStore(persist_directory=self.config.chroma.persist_directory)
+            vector_store = get_vector_store(self.config.chroma.persist_directory)
         except Exception as e:
             return self.format_error(f"Could not initialize vector store: {e}")
         
@@ -2,73 +2,75 @@
 Story bible management tools for MCP.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from mcp.types import Tool, TextContent
 
 from backend.mcp.tools.base import BaseTool
-from backend.memory.database import Database
-from backend.memory.vector_store import VectorStore
+from backend.memory.database import get_database
+from backend.memory.vector_store import get_vector_store
 from backend.utils.config import get_config
 
 
 class StoryBibleTools(BaseTool):
     """Tools for managing the story bible (characters, locations, rules, themes)."""
     
+    _TOOLS: Tuple[Tool, ...] = (
+        Tool(
+            name="get_story_bible",
+            description="Get the story bible for a project (characters, locations, rules, themes)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The project ID"
+                    },
+                    "element_type": {
+                        "type": "string",
+                        "description": "Optional: Filter by type (character, location, rule, theme)",
+                        "enum": ["character", "location", "rule", "theme"]
+                    }
+                },
+                "required": ["project_id"]
+            }
+        ),
+        Tool(
+            name="add_story_element",
+            description="Add a new element to the story bible (character, location, rule, or theme)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "The project ID"
+                    },
+                    "element_type": {
+                        "type": "string",
+                        "description": "Type of element",
+                        "enum": ["character", "location", "rule", "theme"]
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Name of the element"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "Detailed description of the element"
+                    }
+                },
+                "required": ["project_id", "element_type", "name", "description"]
+            }
+        ),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.db = Database()
         self.config = get_config()
+        self.db = get_database(self.config.database.path)
     
     def get_tools(self) -> List[Tool]:
         """Return story bible tool definitions."""
-        return [
-            Tool(
-                name="get_story_bible",
-                description="Get the story bible for a project (characters, locations, rules, themes)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The project ID"
-                        },
-                        "element_type": {
-                            "type": "string",
-                            "description": "Optional: Filter by type (character, location, rule, theme)",
-                            "enum": ["character", "location", "rule", "theme"]
-                        }
-                    },
-                    "required": ["project_id"]
-                }
-            ),
-            Tool(
-                name="add_story_element",
-                description="Add a new element to the story bible (character, location, rule, or theme)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "The project ID"
-                        },
-                        "element_type": {
-                            "type": "string",
-                            "description": "Type of element",
-                            "enum": ["character", "location", "rule", "theme"]
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Name of the element"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Detailed description of the element"
-                        }
-                    },
-                    "required": ["project_id", "element_type", "name", "description"]
-                }
-            ),
-        ]
+        return list(self._TOOLS)
     
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Execute a story bible tool."""
@@ -129,8 +131,9 @@ class StoryBibleTools(BaseTool):
         
         # Create story element
         import uuid
-        element_id = str(uuid.uuid4())
-        self.db.create_story_element(
+        element_id = uuid.uuid4().hex
+        await self.run_blocking(
+            self.db.create_story_element,
             element_id=element_id,
             project_id=project_id,
             element_type=element_type,
@@ -140,7 +143,7 @@ class StoryBibleTools(BaseTool):
         
         # Add to vector store for semantic search
         try:
-            vector_store = VectorStore(persist_directory=self.config.chroma.persist_directory)
+            vector_store = get_vector_store(self.config.chroma.persist_directory)
             vector_store.add_story_bible_element(
                 project_id=project_id,
                 element_type=element_type,
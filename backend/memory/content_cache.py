@@ -0,0 +1,53 @@
+"""
+Content Cache module for ScribeNet.
+Reuses LLM results for text that has already been processed.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ContentCache:
+    """
+    LRU cache of LLM results keyed by project and a hash of the input text.
+
+    Used to skip repeat summaries and critiques of unchanged chapters.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(project_id: Optional[Hashable], *texts: str) -> str:
+        """Build a cache key from a project and the texts a result depends on."""
+        digest = hashlib.blake2b(digest_size=16)
+        for text in texts:
+            digest.update(text.encode())
+            digest.update(b"\0")
+        return f"{digest.hexdigest()}:{project_id}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result, or None on a miss."""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: str, value: Any):
+        """Store a result, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
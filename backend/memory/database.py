@@ -11,12 +11,16 @@ This module uses a modular architecture with separate components for each domain
 - db.chat: Chat message operations
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from backend.memory.db.base import DatabaseBase
 from backend.memory.db.projects import ProjectOperations
 from backend.memory.db.chapters import ChapterOperations
 from backend.memory.db.story_bible import StoryBibleOperations
 from backend.memory.db.analysis import AnalysisOperations
 from backend.memory.db.chat import ChatOperations
+from backend.utils.config import get_config
 
 
 class Database(
@@ -39,9 +43,35 @@ class Database(
     - ChatOperations: Chat message management
     """
     
-    def __init__(self, db_path: str = "data/scribenet.db"):
+    def __init__(self, db_path: str = "data/scribenet.db", pool_size: int = 8):
         """Initialize the database with all components."""
-        # Call parent __init__ to set up connection and schema
-        DatabaseBase.__init__(self, db_path)
+        # Call parent __init__ to set up connection pool and schema
+        DatabaseBase.__init__(self, db_path, pool_size)
+
+
+def get_database(
+    db_path: str = "data/scribenet.db",
+    pool_size: Optional[int] = None,
+) -> Database:
+    """
+    Get a process-wide Database for a path.
+    
+    Sharing one instance means the schema setup runs once and every caller
+    draws from the same connection pool.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        pool_size: Idle connections to keep open (defaults to database.pool_size in config)
+        
+    Returns:
+        Shared Database instance
+    """
+    if pool_size is None:
+        pool_size = get_config().database.pool_size
+    return _shared_database(db_path, pool_size)
 
 
+@lru_cache(maxsize=None)
+def _shared_database(db_path: str, pool_size: int) -> Database:
+    """One Database per resolved (db_path, pool_size) pair."""
+    return Database(db_path, pool_size)
@@ -3,50 +3,131 @@ Base database module for ScribeNet.
 Handles connection management and schema initialization.
 """
 
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 
 
+# Per-connection prepared statement cache size (sqlite3 default: 128)
+STATEMENT_CACHE_SIZE = 256
+
+
 class DatabaseBase:
     """Base class providing connection management and schema initialization."""
 
-    def __init__(self, db_path: str = "data/scribenet.db"):
+    def __init__(self, db_path: str = "data/scribenet.db", pool_size: int = 8):
         self.db_path = db_path
+        # "file:" paths are SQLite URIs, e.g. "file:test?mode=memory&cache=shared"
+        self._uri = db_path.startswith("file:")
         # For in-memory databases, we need to maintain a persistent connection
         self._persistent_conn = None
-        if db_path == ":memory:":
-            self._persistent_conn = sqlite3.connect(":memory:")
+        # The in-memory connection is shared by every thread, so only one
+        # outer get_connection block may use it at a time
+        self._persistent_lock = threading.Lock()
+        # Idle file-based connections, reused so pragmas and page cache stay warm
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+        # Connection currently checked out by this thread, for nested use
+        self._local = threading.local()
+        if db_path == ":memory:" or (self._uri and "mode=memory" in db_path):
+            self._persistent_conn = sqlite3.connect(
+                db_path, check_same_thread=False, uri=self._uri, cached_statements=STATEMENT_CACHE_SIZE
+            )
             self._persistent_conn.row_factory = sqlite3.Row
-        else:
+        elif not self._uri:
             # Ensure data directory exists for file-based databases
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new file-based connection with performance pragmas applied."""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, uri=self._uri, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take a connection from the pool, opening one if none are idle."""
+        if self._persistent_conn:
+            return self._persistent_conn
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        if conn is self._persistent_conn:
+            return
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """
+        Context manager for database connections.
+
+        Nested calls on the same thread share the outer connection, so the
+        whole block commits or rolls back as one transaction.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
         if self._persistent_conn:
-            # For in-memory databases, use the persistent connection
-            # Don't close it, just yield it
-            try:
-                yield self._persistent_conn
-                self._persistent_conn.commit()
-            except Exception:
-                self._persistent_conn.rollback()
-                raise
+            with self._persistent_lock:
+                yield from self._checkout()
         else:
-            # For file-based databases, create a new connection each time
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+            yield from self._checkout()
+
+    def _checkout(self):
+        """Hold a connection for this thread until the outer block exits."""
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several operations into a single transaction.
+
+        Every operation called inside the block runs on one connection and
+        is committed once at the end (or rolled back together on error).
+        """
+        with self.get_connection() as conn:
+            if not conn.in_transaction:
+                # Take the write lock up front so a block that reads before
+                # writing can't hit SQLITE_BUSY when upgrading its lock
+                conn.execute("BEGIN IMMEDIATE")
+            yield self
+
+    def close(self):
+        """Close all pooled connections (and the in-memory connection, if any)."""
+        while True:
             try:
-                yield conn
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        if self._persistent_conn:
+            self._persistent_conn.close()
+            self._persistent_conn = None
 
     def init_database(self):
         """Initialize database schema."""
@@ -7,6 +7,16 @@ import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+# Shared by the single-row and bulk inserts so both hit the same cached statement
+_INSERT_CHAPTER = """
+    INSERT INTO chapters (id, project_id, chapter_number, title, outline, status)
+    VALUES (?, ?, ?, ?, ?, 'planning')
+"""
+_INSERT_CHAPTER_VERSION = """
+    INSERT INTO chapter_versions (id, chapter_id, version, content, created_by, agent_name, model, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class ChapterOperations:
     """Mixin class for chapter-related database operations."""
@@ -23,14 +33,24 @@ class ChapterOperations:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO chapters (id, project_id, chapter_number, title, outline, status)
-                VALUES (?, ?, ?, ?, ?, 'planning')
-            """,
+                _INSERT_CHAPTER,
                 (chapter_id, project_id, chapter_number, title, outline),
             )
             return self.get_chapter(chapter_id)
 
+    def bulk_create_chapters(self, rows: List[Dict[str, Any]]) -> int:
+        """Create many chapters in one transaction. Returns the number inserted."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                _INSERT_CHAPTER,
+                [
+                    (row["id"], row["project_id"], row["chapter_number"], row.get("title"), row.get("outline"))
+                    for row in rows
+                ],
+            )
+            return cursor.rowcount
+
     def get_chapter(self, chapter_id: str) -> Optional[Dict[str, Any]]:
         """Get chapter by ID."""
         with self.get_connection() as conn:
@@ -56,7 +76,9 @@ class ChapterOperations:
     def update_chapter(self, chapter_id: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Update chapter fields."""
         allowed_fields = ["title", "outline", "status", "word_count", "version"]
-        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        # Field order follows allowed_fields, so each column combination
+        # always produces the same SQL text and reuses its cached statement
+        updates = {k: kwargs[k] for k in allowed_fields if k in kwargs}
 
         if not updates:
             return self.get_chapter(chapter_id)
@@ -89,10 +111,7 @@ class ChapterOperations:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO chapter_versions (id, chapter_id, version, content, created_by, agent_name, model, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+                _INSERT_CHAPTER_VERSION,
                 (version_id, chapter_id, version, content, created_by, agent_name, model, metadata_json),
             )
 
@@ -105,6 +124,28 @@ class ChapterOperations:
                 result["metadata"] = json.loads(result["metadata"])
             return result
 
+    def bulk_save_chapter_versions(self, rows: List[Dict[str, Any]]) -> int:
+        """Save many chapter versions in one transaction. Returns the number inserted."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                _INSERT_CHAPTER_VERSION,
+                [
+                    (
+                        row["id"],
+                        row["chapter_id"],
+                        row["version"],
+                        row["content"],
+                        row["created_by"],
+                        row.get("agent_name"),
+                        row.get("model"),
+                        json.dumps(row["metadata"]) if row.get("metadata") else None,
+                    )
+                    for row in rows
+                ],
+            )
+            return cursor.rowcount
+
     def get_chapter_versions(self, chapter_id: str) -> List[Dict[str, Any]]:
         """Get all versions of a chapter."""
         with self.get_connection() as conn:
@@ -119,6 +160,16 @@ class ChapterOperations:
                     result["metadata"] = json.loads(result["metadata"])
             return results
 
+    def get_latest_version_number(self, chapter_id: str) -> int:
+        """Get the highest saved version number for a chapter (0 if it has none)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT MAX(version) FROM chapter_versions WHERE chapter_id = ?",
+                (chapter_id,),
+            )
+            return cursor.fetchone()[0] or 0
+
     def get_latest_chapter_content(self, chapter_id: str) -> Optional[str]:
         """Get the latest content for a chapter."""
         with self.get_connection() as conn:
@@ -52,7 +52,9 @@ class ProjectOperations:
     def update_project(self, project_id: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Update project fields."""
         allowed_fields = ["title", "genre", "status", "vision_document", "outline", "target_chapters"]
-        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        # Field order follows allowed_fields, so each column combination
+        # always produces the same SQL text and reuses its cached statement
+        updates = {k: kwargs[k] for k in allowed_fields if k in kwargs}
 
         if not updates:
             return self.get_project(project_id)
@@ -159,7 +159,7 @@ class StoryBibleOperations:
                 if not isinstance(elements, list):
                     # Handle worldbuilding_rules which might be a dict
                     if element_type == "worldbuilding_rules":
-                        element_id = str(uuid.uuid4())
+                        element_id = uuid.uuid4().hex
                         cursor.execute(
                             """INSERT INTO story_elements (id, project_id, element_type, name, data)
                                VALUES (?, ?, ?, ?, ?)""",
@@ -168,7 +168,7 @@ class StoryBibleOperations:
                     continue
                 
                 for element in elements:
-                    element_id = str(uuid.uuid4())
+                    element_id = uuid.uuid4().hex
                     name = element.get("name", element.get("theme", element.get("id", "unnamed")))
                     cursor.execute(
                         """INSERT INTO story_elements (id, project_id, element_type, name, data)
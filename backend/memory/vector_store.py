@@ -3,13 +3,76 @@ Vector Store module for ScribeNet.
 Handles ChromaDB operations for semantic search and embedding storage.
 """
 
-import json
+import asyncio
+import os
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import chromadb
+from chromadb.api import ClientAPI
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
 
+from backend.utils.config import get_config
+
+# Embedding is CPU-bound and the model is a single shared resource, so all
+# async calls funnel through one worker thread instead of the event loop.
+_embed_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+
+
+@lru_cache(maxsize=None)
+def make_http_client(host: str = "localhost", port: int = 8000, ssl: bool = False) -> ClientAPI:
+    """
+    Get a process-wide client for a Chroma server.
+    
+    Cached per (host, port, ssl) so every VectorStore in the process shares
+    one client and its underlying HTTP connection pool.
+    
+    Args:
+        host: Chroma server host
+        port: Chroma server port
+        ssl: Whether to connect over HTTPS
+        
+    Returns:
+        Shared Chroma HTTP client
+    """
+    return chromadb.HttpClient(
+        host=host,
+        port=port,
+        ssl=ssl,
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+
+def get_vector_store(
+    persist_directory: str = "data/chroma",
+    preload: Optional[bool] = None,
+) -> "VectorStore":
+    """
+    Get a process-wide VectorStore for a persist directory.
+    
+    Opening a store loads the embedding model and the collections, so tools
+    share one instance instead of constructing it on every call.
+    
+    Args:
+        persist_directory: Directory to persist ChromaDB data
+        preload: Warm the store on creation (defaults to chroma.preload in config)
+        
+    Returns:
+        Shared VectorStore instance
+    """
+    if preload is None:
+        preload = get_config().chroma.preload
+    return _shared_vector_store(persist_directory, preload)
+
+
+@lru_cache(maxsize=None)
+def _shared_vector_store(persist_directory: str, preload: bool) -> "VectorStore":
+    """One VectorStore per resolved (persist_directory, preload) pair."""
+    return VectorStore(persist_directory=persist_directory, preload=preload)
+
 
 class VectorStore:
     """
@@ -22,23 +85,35 @@ class VectorStore:
     - research_notes: User-provided background material
     """
     
-    def __init__(self, persist_directory: str = "data/chroma"):
+    def __init__(
+        self,
+        persist_directory: str = "data/chroma",
+        client: Optional[ClientAPI] = None,
+        preload: bool = False
+    ):
         """
         Initialize ChromaDB client.
         
         Args:
             persist_directory: Directory to persist ChromaDB data
+            client: Optional pre-built client (e.g. from make_http_client()).
+                When given, persist_directory is ignored.
+            preload: Warm the embedding model and page cache up front so the
+                first queries don't stall on cold loads
         """
-        Path(persist_directory).mkdir(parents=True, exist_ok=True)
-        
-        # Initialize ChromaDB client with persistence
-        self.client = chromadb.PersistentClient(
-            path=persist_directory,
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
+        if client is not None:
+            self.client = client
+        else:
+            Path(persist_directory).mkdir(parents=True, exist_ok=True)
+            
+            # Initialize ChromaDB client with persistence
+            self.client = chromadb.PersistentClient(
+                path=persist_directory,
+                settings=Settings(
+                    anonymized_telemetry=False,
+                    allow_reset=True
+                )
             )
-        )
         
         # Use sentence transformers for embeddings
         # all-MiniLM-L6-v2 is fast and efficient for semantic search
@@ -48,6 +123,33 @@ class VectorStore:
         
         # Initialize collections
         self._init_collections()
+        
+        if preload:
+            self._preload(persist_directory if client is None else None)
+    
+    def _preload(self, persist_directory: Optional[str] = None):
+        """
+        Warm the embedding model and read local index files into page cache.
+        
+        Args:
+            persist_directory: Local Chroma directory, or None for server mode
+        """
+        # First encode pays one-time model/kernel setup; do it now
+        self.embedding_function(["warmup"])
+        
+        if persist_directory is None or not hasattr(os, "posix_fadvise"):
+            return
+        
+        # Ask the kernel to start reading HNSW segment files in the background
+        for path in Path(persist_directory).rglob("*.bin"):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass  # Best effort only
     
     def _init_collections(self):
         """Initialize or get existing collections."""
@@ -79,6 +181,17 @@ class VectorStore:
             metadata={"description": "User-provided background material"}
         )
     
+    @staticmethod
+    def _canon_filter(**kwargs) -> tuple:
+        """
+        Build a canonical, hashable form of a metadata filter.
+        
+        Empty values are dropped and keys are sorted, so the same filter
+        always yields the same tuple. dict() of the result is the Chroma
+        where clause.
+        """
+        return tuple(sorted((k, v) for k, v in kwargs.items() if v))
+    
     # ==================== Chapter Operations ====================
     
     def add_chapter(
@@ -139,15 +252,14 @@ class VectorStore:
             List of matching chapters with content and metadata
         """
         # Build filter
-        filters = where_filter or {}
-        if project_id:
-            filters["project_id"] = project_id
+        fkey = self._canon_filter(project_id=project_id)
+        filters = {**(where_filter or {}), **dict(fkey)} or None
         
         # Perform search
         results = self.chapters_collection.query(
             query_texts=[query],
             n_results=n_results,
-            where=filters if filters else None
+            where=filters
         )
         
         # Format results
@@ -163,6 +275,20 @@ class VectorStore:
         
         return formatted
     
+    async def aadd_chapter(self, *args, **kwargs):
+        """Async variant of add_chapter; embeds on the shared embedding thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _embed_pool, partial(self.add_chapter, *args, **kwargs)
+        )
+    
+    async def asearch_chapters(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of search_chapters; embeds on the shared embedding thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _embed_pool, partial(self.search_chapters, *args, **kwargs)
+        )
+    
     def get_chapters_by_characters(
         self,
         project_id: str,
@@ -252,16 +378,12 @@ class VectorStore:
         Returns:
             List of matching story bible elements
         """
-        filters = {}
-        if project_id:
-            filters["project_id"] = project_id
-        if element_type:
-            filters["element_type"] = element_type
+        fkey = self._canon_filter(project_id=project_id, element_type=element_type)
         
         results = self.story_bible_collection.query(
             query_texts=[query],
             n_results=n_results,
-            where=filters if filters else None
+            where=dict(fkey) or None
         )
         
         formatted = []
@@ -332,7 +454,7 @@ class VectorStore:
         example_metadata = {
             "project_id": project_id,
             "document_type": "style_example",
-            "style_tags": json.dumps(style_tags),
+            "style_tags": orjson.dumps(style_tags).decode(),
             **metadata
         }
         
@@ -359,14 +481,12 @@ class VectorStore:
         Returns:
             List of similar style examples
         """
-        filters = {}
-        if project_id:
-            filters["project_id"] = project_id
+        fkey = self._canon_filter(project_id=project_id)
         
         results = self.style_collection.query(
             query_texts=[reference_text],
             n_results=n_results,
-            where=filters if filters else None
+            where=dict(fkey) or None
         )
         
         formatted = []
@@ -407,7 +527,7 @@ class VectorStore:
         note_metadata = {
             "project_id": project_id,
             "document_type": "research",
-            "tags": json.dumps(tags),
+            "tags": orjson.dumps(tags).decode(),
             **metadata
         }
         
@@ -434,14 +554,12 @@ class VectorStore:
         Returns:
             List of matching research notes
         """
-        filters = {}
-        if project_id:
-            filters["project_id"] = project_id
+        fkey = self._canon_filter(project_id=project_id)
         
         results = self.research_collection.query(
             query_texts=[query],
             n_results=n_results,
-            where=filters if filters else None
+            where=dict(fkey) or None
         )
         
         formatted = []
@@ -0,0 +1,72 @@
+"""
+Background job queue for ScribeNet.
+Runs slow, non-critical blocking work (e.g. git commits) off the request path.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+
+
+async def _run_jobs(queue: asyncio.Queue):
+    """Run queued jobs one at a time in a worker thread."""
+    while True:
+        func, args, kwargs = await queue.get()
+        try:
+            await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Background job {getattr(func, '__name__', func)} failed: {e}", exc_info=True)
+        finally:
+            queue.task_done()
+
+
+def submit(func: Callable[..., Any], *args, **kwargs):
+    """
+    Queue a blocking call to run in the background, in submission order.
+
+    Must be called from a running event loop; the worker is started on first use.
+
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+    """
+    global _queue, _worker
+
+    loop = asyncio.get_running_loop()
+    if _worker is None or _worker.done() or _worker.get_loop() is not loop:
+        _queue = asyncio.Queue()
+        _worker = loop.create_task(_run_jobs(_queue))
+
+    _queue.put_nowait((func, args, kwargs))
+
+
+async def drain(timeout: Optional[float] = 30.0):
+    """
+    Wait for queued jobs to finish, then stop the worker.
+
+    Args:
+        timeout: Seconds to wait before abandoning unfinished jobs (None waits forever)
+    """
+    global _queue, _worker
+
+    if _worker is None:
+        return
+
+    if not _worker.done() and _worker.get_loop() is asyncio.get_running_loop():
+        try:
+            await asyncio.wait_for(_queue.join(), timeout)
+        except asyncio.TimeoutError:
+            # A job stuck in its thread can't be interrupted; drop it and the rest
+            logger.warning(
+                f"Background jobs still running after {timeout}s; "
+                f"abandoning the current job and {_queue.qsize()} queued"
+            )
+        _worker.cancel()
+    _queue = None
+    _worker = None
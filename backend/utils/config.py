@@ -1,8 +1,10 @@
 """Configuration management for ScribeNet."""
 
+import threading
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
 from pydantic import BaseModel, Field
 
 
@@ -70,18 +72,22 @@ class LLMConfig(BaseModel):
 class DatabaseConfig(BaseModel):
     """Database configuration."""
     path: str = "data/scribenet.db"
+    pool_size: int = 8  # Idle SQLite connections kept open for reuse
 
 
 class GitConfig(BaseModel):
     """Git configuration."""
-    auto_commit: bool = True
-    commit_on: list = Field(default_factory=lambda: ["chapter_complete", "outline_update"])
+    auto_commit: bool = False  # Opt in to committing project files to git
+    commit_on: FrozenSet[str] = Field(
+        default_factory=lambda: frozenset({"chapter_complete", "outline_update"})
+    )
     projects_path: str = "data/projects"
 
 
 class ChromaConfig(BaseModel):
     """ChromaDB configuration."""
     persist_directory: str = "data/chroma"
+    preload: bool = False  # Warm the embedding model and index files on startup
 
 
 class MCPServerConfig(BaseModel):
@@ -116,27 +122,44 @@ class Config(BaseModel):
 class ConfigManager:
     """Configuration manager."""
 
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", check_interval: float = 1.0):
         self.config_path = Path(config_path)
+        # Minimum seconds between file mtime checks on config access
+        self.check_interval = check_interval
         self._config: Optional[Config] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
 
     def load(self) -> Config:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        with open(self.config_path, "r") as f:
-            config_dict = yaml.safe_load(f)
-
-        self._config = Config(**config_dict)
+        """Load configuration from YAML, reusing the parsed copy while the file is unchanged."""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
+        self._checked_at = time.monotonic()
+
+        if self._config is not None and mtime == self._mtime:
+            return self._config
+
+        with self._lock:
+            # Another thread may have reloaded while we waited
+            if self._config is not None and mtime == self._mtime:
+                return self._config
+
+            with open(self.config_path, "r") as f:
+                config_dict = yaml.safe_load(f)
+
+            self._config = Config(**config_dict)
+            self._mtime = mtime
         return self._config
 
     @property
     def config(self) -> Config:
-        """Get configuration, loading if necessary."""
-        if self._config is None:
-            self.load()
-        return self._config
+        """Get configuration, checking at most once per check_interval whether the file changed."""
+        if self._config is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._config
+        return self.load()
 
     def get_agent_config(self, agent_type: str, agent_name: Optional[str] = None) -> AgentConfig:
         """Get configuration for a specific agent."""
@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the MCP tool tests.
+
+Tool instances are built once per test module, since constructing them sets
+up agents, config and git; each test file's own fixture then wires fresh
+mocks and stub agents onto the shared instance. Backend modules are imported
+inside the fixtures so collecting tests doesn't load the whole tool graph.
+"""
+
+import asyncio
+import pytest
+
+
+class StubAgent:
+    """Lightweight agent stand-in returning a canned result; cheaper than AsyncMock."""
+    
+    def __init__(self, ret=None, delay=0):
+        self.ret = ret
+        self.delay = delay
+        self.calls = 0
+    
+    async def execute(self, *args, **kwargs):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.ret
+
+
+@pytest.fixture
+def stub_agent():
+    """Factory for StubAgent instances."""
+    return StubAgent
+
+
+@pytest.fixture
+def run_tool():
+    """Coroutine that stubs db return values and then executes a tool."""
+    async def run(tools, tool_name, arguments, db_returns=None):
+        for method, value in (db_returns or {}).items():
+            getattr(tools.db, method).return_value = value
+        return await tools.execute(tool_name, arguments)
+    return run
+
+
+@pytest.fixture(scope="module")
+def shared_outline_tools():
+    """Build OutlineTools once per module."""
+    from backend.mcp.tools.outline_tools import OutlineTools
+    return OutlineTools()
+
+
+@pytest.fixture(scope="module")
+def shared_project_tools():
+    """Build ProjectTools once per module."""
+    from backend.mcp.tools.project_tools import ProjectTools
+    return ProjectTools()
+
+
+@pytest.fixture(scope="module")
+def shared_story_bible_tools():
+    """Build StoryBibleTools once per module."""
+    from backend.mcp.tools.story_bible_tools import StoryBibleTools
+    return StoryBibleTools()
+
+
+@pytest.fixture(scope="module")
+def shared_search_tools():
+    """Build SearchTools once per module."""
+    from backend.mcp.tools.search_tools import SearchTools
+    return SearchTools()
@@ -0,0 +1,48 @@
+"""
+Unit tests for the background job queue.
+"""
+
+import threading
+from backend.utils import background
+
+
+class TestBackground:
+    """Test suite for the background job queue."""
+    
+    async def test_jobs_run_in_order(self):
+        """Test that queued jobs run in submission order before drain returns."""
+        calls = []
+        
+        background.submit(calls.append, 1)
+        background.submit(calls.append, 2)
+        assert calls == []
+        
+        await background.drain()
+        assert calls == [1, 2]
+    
+    async def test_failed_job_does_not_stop_worker(self):
+        """Test that an exception in one job doesn't block later jobs."""
+        calls = []
+        
+        def fail():
+            raise RuntimeError("boom")
+        
+        background.submit(fail)
+        background.submit(calls.append, "after")
+        
+        await background.drain()
+        assert calls == ["after"]
+    
+    async def test_drain_gives_up_on_hung_job(self):
+        """Test that drain returns after its timeout instead of waiting on a stuck job."""
+        release = threading.Event()
+        calls = []
+        
+        background.submit(release.wait)
+        background.submit(calls.append, "never")
+        
+        try:
+            await background.drain(timeout=0.05)
+        finally:
+            release.set()
+        assert calls == []
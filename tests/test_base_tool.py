@@ -3,6 +3,7 @@ Unit tests for Base Tool functionality.
 """
 
 import pytest
+import threading
 from backend.mcp.tools.base import BaseTool
 from mcp.types import TextContent, Tool
 from typing import List, Dict, Any
@@ -71,10 +72,19 @@ class TestBaseTool:
         assert len(tools) == 1
         assert tools[0].name == "test_tool"
     
-    @pytest.mark.asyncio
     async def test_execute_returns_text_content(self, base_tool):
         """Test that execute returns TextContent list."""
         result = await base_tool.execute("test_tool", {})
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], TextContent)
+    
+    async def test_run_blocking_runs_off_loop_thread(self, base_tool):
+        """Test that run_blocking runs the call in a worker thread and returns its result."""
+        def work(a, b=0):
+            return threading.get_ident(), a + b
+        
+        thread_id, total = await base_tool.run_blocking(work, 1, b=2)
+        
+        assert total == 3
+        assert thread_id != threading.get_ident()
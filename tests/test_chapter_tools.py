@@ -3,22 +3,48 @@ Unit tests for MCP Chapter Tools.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
-from backend.mcp.tools.chapter_tools import ChapterTools
+from types import MappingProxyType
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from backend.utils import background
+
+
+# Read-only project rows shared across tests
+_PROJECT = MappingProxyType({
+    "id": "proj-1",
+    "title": "Test Novel",
+    "outline": "Chapter 1: Introduction"
+})
+_PROJECT_WITH_VISION = MappingProxyType({**_PROJECT, "vision_document": "A great story"})
+_PROJECT_NO_OUTLINE = MappingProxyType({**_PROJECT, "outline": None})
 
 
 class TestChapterTools:
     """Test suite for ChapterTools class."""
     
     @pytest.fixture
-    def chapter_tools(self):
+    def chapter_tools(self, stub_agent):
         """Create ChapterTools instance with mocked dependencies."""
+        from backend.mcp.tools.chapter_tools import ChapterTools
         tools = ChapterTools()
-        tools.db = Mock()
+        tools.db = MagicMock()
         tools.vector_store = Mock()
-        tools.writer = AsyncMock()
+        tools.vector_store.aadd_chapter = AsyncMock()
+        tools.vector_store.asearch_chapters = AsyncMock(return_value=[])
+        tools.writer = stub_agent(ret={"content": "A fresh draft."})
+        tools.git = Mock()
+        tools.commit_chapters = True
         return tools
     
+    def test_git_not_set_up_without_auto_commit(self):
+        """Test that the git repository is left alone when auto-commit is off."""
+        from backend.mcp.tools.chapter_tools import ChapterTools
+        with patch("backend.mcp.tools.chapter_tools.GitManager") as mock_git:
+            tools = ChapterTools()
+        
+        assert tools.commit_chapters is False
+        assert tools.git is None
+        mock_git.assert_not_called()
+    
     def test_get_tools_returns_three_tools(self, chapter_tools):
         """Test that get_tools returns 3 tool definitions."""
         tools = chapter_tools.get_tools()
@@ -29,7 +55,13 @@ class TestChapterTools:
         assert "get_chapter_content" in tool_names
         assert "write_chapter" in tool_names
     
-    @pytest.mark.asyncio
+    def test_get_tools_reuses_definitions(self, chapter_tools):
+        """Test that tool definitions are built once and each caller gets its own list."""
+        first, second = chapter_tools.get_tools(), chapter_tools.get_tools()
+        
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+    
     async def test_list_chapters_success(self, chapter_tools):
         """Test listing chapters successfully."""
         chapter_tools.db.list_chapters.return_value = [
@@ -47,7 +79,6 @@ class TestChapterTools:
         assert "2500" in result[0].text
         chapter_tools.db.list_chapters.assert_called_once_with("proj-1")
     
-    @pytest.mark.asyncio
     async def test_list_chapters_empty(self, chapter_tools):
         """Test listing chapters when none exist."""
         chapter_tools.db.list_chapters.return_value = []
@@ -57,7 +88,6 @@ class TestChapterTools:
         assert len(result) == 1
         assert "No chapters found" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_list_chapters_with_scores(self, chapter_tools):
         """Test listing chapters with quality scores."""
         chapter_tools.db.list_chapters.return_value = [
@@ -72,7 +102,6 @@ class TestChapterTools:
         assert len(result) == 1
         assert "8.5" in result[0].text or "Quality Score" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_get_chapter_content_success(self, chapter_tools):
         """Test getting chapter content successfully."""
         # Mock the helper method we'll create
@@ -95,7 +124,6 @@ class TestChapterTools:
         assert "Once upon a time" in result[0].text
         assert "2500" in result[0].text
     
-    @pytest.mark.asyncio
     async def test_get_chapter_content_not_found(self, chapter_tools):
         """Test getting chapter content when chapter doesn't exist."""
         chapter_tools._get_chapter_by_number = Mock(return_value=None)
@@ -108,19 +136,12 @@ class TestChapterTools:
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
     
-    @pytest.mark.asyncio
     async def test_write_chapter_success(self, chapter_tools):
         """Test writing a chapter successfully."""
         # Mock dependencies
-        chapter_tools.db.get_project.return_value = {
-            "id": "proj-1",
-            "title": "Test Novel",
-            "outline": "Chapter 1: Introduction",
-            "vision_document": "A great story"
-        }
+        chapter_tools.db.get_project.return_value = _PROJECT_WITH_VISION
         chapter_tools.db.list_chapters.return_value = []
-        chapter_tools.vector_store.search_chapters.return_value = []
-        chapter_tools.writer.execute.return_value = {
+        chapter_tools.writer.ret = {
             "content": "This is the chapter content. It has many words."
         }
         chapter_tools.db.create_chapter.return_value = {
@@ -139,17 +160,63 @@ class TestChapterTools:
         
         assert len(result) == 1
         assert "Wrote Chapter" in result[0].text or "✅" in result[0].text
-        assert chapter_tools.writer.execute.called
+        assert chapter_tools.writer.calls == 1
         assert chapter_tools.db.create_chapter.called
+        chapter_tools.vector_store.aadd_chapter.assert_awaited_once()
+        
+        await background.drain()
+        chapter_tools.git.save_chapter.assert_called_once()
+    
+    async def test_write_chapter_existing_adds_version(self, chapter_tools):
+        """Test rewriting an existing chapter saves a new version on the same row."""
+        chapter_tools.db.get_project.return_value = _PROJECT
+        chapter_tools.db.list_chapters.return_value = [
+            {"id": "ch-1", "chapter_number": 1, "status": "draft", "version": 1}
+        ]
+        chapter_tools.db.get_latest_version_number.return_value = 1
+        
+        await chapter_tools.execute("write_chapter", {
+            "project_id": "proj-1",
+            "chapter_number": 1
+        })
+        
+        chapter_tools.db.create_chapter.assert_not_called()
+        saved = chapter_tools.db.save_chapter_version.call_args.kwargs
+        assert saved['chapter_id'] == "ch-1"
+        assert saved['version'] == 2
+    
+    async def test_write_chapter_failed_save_skips_indexing(self, chapter_tools):
+        """Test a chapter whose save rolls back is never added to the vector store."""
+        chapter_tools.db.get_project.return_value = _PROJECT
+        chapter_tools.db.list_chapters.return_value = []
+        chapter_tools.db.save_chapter_version.side_effect = RuntimeError("disk full")
+        
+        with pytest.raises(RuntimeError, match="disk full"):
+            await chapter_tools.execute("write_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1
+            })
+        
+        chapter_tools.vector_store.aadd_chapter.assert_not_awaited()
+    
+    async def test_write_chapter_timeout(self, chapter_tools):
+        """Test a hung writer call returns an error instead of blocking."""
+        chapter_tools.llm_timeout = 0.01
+        chapter_tools.db.get_project.return_value = _PROJECT
+        chapter_tools.db.list_chapters.return_value = []
+        chapter_tools.writer.delay = 1
+        
+        result = await chapter_tools.execute("write_chapter", {
+            "project_id": "proj-1",
+            "chapter_number": 1
+        })
+        
+        assert "timed out" in result[0].text
+        chapter_tools.db.create_chapter.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_write_chapter_no_outline(self, chapter_tools):
         """Test writing chapter fails when project has no outline."""
-        chapter_tools.db.get_project.return_value = {
-            "id": "proj-1",
-            "title": "Test Novel",
-            "outline": None
-        }
+        chapter_tools.db.get_project.return_value = _PROJECT_NO_OUTLINE
         
         result = await chapter_tools.execute("write_chapter", {
             "project_id": "proj-1",
@@ -159,7 +226,6 @@ class TestChapterTools:
         assert len(result) == 1
         assert "outline" in result[0].text.lower()
     
-    @pytest.mark.asyncio
     async def test_write_chapter_project_not_found(self, chapter_tools):
         """Test writing chapter when project doesn't exist."""
         chapter_tools.db.get_project.return_value = None
@@ -171,9 +237,3 @@ class TestChapterTools:
         
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
-    
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, chapter_tools):
-        """Test executing an unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await chapter_tools.execute("nonexistent_tool", {})
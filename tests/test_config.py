@@ -0,0 +1,49 @@
+"""
+Unit tests for configuration loading.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from backend.utils.config import ConfigManager
+
+
+class TestConfigManager:
+    """Test suite for ConfigManager class."""
+    
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Copy the repository config into a temporary file."""
+        path = tmp_path / "config.yaml"
+        path.write_text(Path("config.yaml").read_text())
+        return path
+    
+    def test_config_is_parsed_once(self, config_path):
+        """Test that repeated access reuses the parsed config."""
+        manager = ConfigManager(str(config_path))
+        
+        assert manager.config is manager.config
+    
+    def test_config_reloads_when_file_changes(self, config_path):
+        """Test that a modified file is parsed again once the check interval passes."""
+        manager = ConfigManager(str(config_path))
+        first = manager.config
+        
+        config_path.write_text(config_path.read_text().replace(
+            "quality_threshold: 7.0", "quality_threshold: 8.5"
+        ))
+        stat = config_path.stat()
+        os.utime(config_path, (stat.st_atime, stat.st_mtime + 1))
+        
+        assert manager.config is first
+        
+        manager.check_interval = 0
+        assert manager.config is not first
+        assert manager.config.project.quality_threshold == 8.5
+    
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing config file raises FileNotFoundError."""
+        manager = ConfigManager(str(tmp_path / "missing.yaml"))
+        
+        with pytest.raises(FileNotFoundError):
+            manager.load()
@@ -0,0 +1,45 @@
+"""
+Unit tests for the content-hash result cache.
+"""
+
+import pytest
+from backend.memory.content_cache import ContentCache
+
+
+class TestContentCache:
+    """Test suite for ContentCache class."""
+    
+    @pytest.fixture
+    def cache(self):
+        """Create a small cache."""
+        return ContentCache(max_size=2)
+    
+    def test_key_depends_on_project_and_text(self):
+        """Test that keys differ by project and by text."""
+        key = ContentCache.key("proj-1", "chapter text")
+        
+        assert key == ContentCache.key("proj-1", "chapter text")
+        assert key != ContentCache.key("proj-2", "chapter text")
+        assert key != ContentCache.key("proj-1", "other text")
+    
+    def test_key_separates_texts(self):
+        """Test that splitting the same characters differently changes the key."""
+        assert ContentCache.key("proj-1", "ab", "c") != ContentCache.key("proj-1", "a", "bc")
+    
+    def test_get_and_put(self, cache):
+        """Test that a stored value is returned and a missing key is None."""
+        cache.put("k1", {"summary": "s"})
+        
+        assert cache.get("k1") == {"summary": "s"}
+        assert cache.get("k2") is None
+    
+    def test_lru_eviction(self, cache):
+        """Test that the least recently used entry is evicted when full."""
+        cache.put("k1", 1)
+        cache.put("k2", 2)
+        cache.get("k1")
+        cache.put("k3", 3)
+        
+        assert cache.get("k1") == 1
+        assert cache.get("k2") is None
+        assert cache.get("k3") == 3
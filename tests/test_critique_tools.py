@@ -3,23 +3,23 @@ Unit tests for MCP Critique Tools.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
-from backend.mcp.tools.critique_tools import CritiqueTools
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 
 class TestCritiqueTools:
     """Test suite for CritiqueTools class."""
     
     @pytest.fixture
-    def critique_tools(self):
+    def critique_tools(self, stub_agent):
         """Create CritiqueTools instance with mocked dependencies."""
+        from backend.mcp.tools.critique_tools import CritiqueTools
         tools = CritiqueTools()
-        tools.db = Mock()
+        tools.db = MagicMock()
         tools.vector_store = Mock()
-        tools.critic = AsyncMock()
-        tools.grammar_editor = AsyncMock()
-        tools.style_editor = AsyncMock()
-        tools.continuity_editor = AsyncMock()
+        tools.critic = stub_agent()
+        tools.grammar_editor = stub_agent()
+        tools.style_editor = stub_agent()
+        tools.continuity_editor = stub_agent()
         return tools
     
     def test_get_tools_returns_two_tools(self, critique_tools):
@@ -31,7 +31,13 @@ class TestCritiqueTools:
         assert "critique_chapter" in tool_names
         assert "revise_chapter" in tool_names
     
-    @pytest.mark.asyncio
+    def test_get_tools_reuses_definitions(self, critique_tools):
+        """Test that tool definitions are built once and each caller gets its own list."""
+        first, second = critique_tools.get_tools(), critique_tools.get_tools()
+        
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+    
     async def test_critique_chapter_success(self, critique_tools):
         """Test successful chapter critique."""
         critique_tools.db.list_chapters.return_value = [{
@@ -42,7 +48,7 @@ class TestCritiqueTools:
             'status': 'draft'
         }]
         critique_tools.db.get_latest_chapter_content.return_value = "Test chapter content"
-        critique_tools.critic.execute.return_value = {
+        critique_tools.critic.ret = {
             'scores': {
                 'overall_score': 8.5,
                 'plot': 9,
@@ -61,10 +67,32 @@ class TestCritiqueTools:
         assert len(result) == 1
         assert "Critique" in result[0].text or "📊" in result[0].text
         assert "8.5" in result[0].text or "9" in result[0].text
-        assert critique_tools.critic.execute.called
+        assert critique_tools.critic.calls == 1
         assert critique_tools.db.save_score.called
     
-    @pytest.mark.asyncio
+    async def test_critique_unchanged_chapter_reuses_result(self, critique_tools):
+        """Test critiquing the same text twice only runs and records it once."""
+        critique_tools.db.list_chapters.return_value = [{
+            'id': 'ch-1',
+            'chapter_number': 1,
+            'status': 'draft'
+        }]
+        critique_tools.db.get_latest_chapter_content.return_value = "Test chapter content"
+        critique_tools.critic.ret = {
+            'scores': {'overall_score': 8},
+            'feedback': 'Good work!',
+            'needs_revision': False
+        }
+        
+        for _ in range(2):
+            await critique_tools.execute("critique_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1
+            })
+        
+        assert critique_tools.critic.calls == 1
+        critique_tools.db.save_score.assert_called_once()
+    
     async def test_critique_chapter_not_found(self, critique_tools):
         """Test critiquing non-existent chapter."""
         critique_tools.db.list_chapters.return_value = []
@@ -77,7 +105,6 @@ class TestCritiqueTools:
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
     
-    @pytest.mark.asyncio
     async def test_critique_chapter_no_content(self, critique_tools):
         """Test critiquing chapter without content."""
         critique_tools.db.list_chapters.return_value = [{
@@ -96,7 +123,6 @@ class TestCritiqueTools:
         assert len(result) == 1
         assert "no content" in result[0].text.lower()
     
-    @pytest.mark.asyncio
     async def test_revise_chapter_not_found(self, critique_tools):
         """Test revising non-existent chapter."""
         critique_tools.db.list_chapters.return_value = []
@@ -110,8 +136,124 @@ class TestCritiqueTools:
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
     
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, critique_tools):
-        """Test executing unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await critique_tools.execute("nonexistent_tool", {})
+    async def test_revise_chapter_styles_grammar_output(self, critique_tools):
+        """Test the style pass edits the grammar pass's corrected text."""
+        critique_tools.db.list_chapters.return_value = [{
+            'id': 'ch-1',
+            'chapter_number': 1,
+            'status': 'draft',
+            'version': 1
+        }]
+        critique_tools.db.get_latest_chapter_content.return_value = "Teh cat sat."
+        # Already revised once since the listed row was read
+        critique_tools.db.get_latest_version_number.return_value = 2
+        critique_tools.grammar_editor.ret = {
+            'edited_content': "The cat sat.",
+            'changes': [{'original': "Teh", 'corrected': "The"}]
+        }
+        critique_tools.style_editor = Mock()
+        critique_tools.style_editor.execute = AsyncMock(return_value={
+            'edited_content': "The cat sat, quietly."
+        })
+        
+        with patch('backend.mcp.tools.critique_tools.get_vector_store') as mock_get_store:
+            mock_get_store.return_value.aadd_chapter = AsyncMock()
+            result = await critique_tools.execute("revise_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1,
+                "focus_areas": ["grammar", "style"]
+            })
+        
+        assert "Revised Chapter 1" in result[0].text
+        saved = critique_tools.db.save_chapter_version.call_args.kwargs
+        assert saved['content'] == "The cat sat, quietly."
+        assert saved['version'] == 3
+        styled = critique_tools.style_editor.execute.call_args.args[0]
+        assert styled['content'] == "The cat sat."
+        indexed = mock_get_store.return_value.aadd_chapter.call_args.kwargs
+        assert indexed['content'] == "The cat sat, quietly."
+    
+    async def test_revise_chapter_passes_current_word_count(self, critique_tools):
+        """Test each editor is told the word count of the text it receives."""
+        critique_tools.db.list_chapters.return_value = [{
+            'id': 'ch-1',
+            'chapter_number': 1,
+            'status': 'draft',
+            'version': 1
+        }]
+        critique_tools.db.get_latest_chapter_content.return_value = "Teh cat sat."
+        critique_tools.db.get_chapters_by_project.return_value = []
+        critique_tools.style_editor.ret = {
+            'edited_content': "The small grey cat sat quietly."
+        }
+        critique_tools.continuity_editor = Mock()
+        critique_tools.continuity_editor.execute = AsyncMock(return_value={
+            'edited_content': "The small grey cat sat quietly."
+        })
+        
+        with patch('backend.mcp.tools.critique_tools.get_vector_store') as mock_get_store:
+            mock_get_store.return_value.aadd_chapter = AsyncMock()
+            await critique_tools.execute("revise_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1,
+                "focus_areas": ["style", "continuity"]
+            })
+        
+        checked = critique_tools.continuity_editor.execute.call_args.args[0]
+        assert checked['word_count'] == 6
+        saved = critique_tools.db.update_chapter.call_args.kwargs
+        assert saved['word_count'] == 6
+    
+    async def test_revise_chapter_unchanged_skips_save(self, critique_tools):
+        """Test a revision that changes nothing doesn't save or re-embed the chapter."""
+        critique_tools.db.list_chapters.return_value = [{
+            'id': 'ch-1',
+            'chapter_number': 1,
+            'status': 'draft',
+            'version': 1
+        }]
+        critique_tools.db.get_latest_chapter_content.return_value = "The cat sat."
+        critique_tools.grammar_editor.ret = {
+            'edited_content': "The cat sat.",
+            'changes': []
+        }
+        
+        with patch('backend.mcp.tools.critique_tools.get_vector_store') as mock_get_store:
+            mock_get_store.return_value.aadd_chapter = AsyncMock()
+            result = await critique_tools.execute("revise_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1,
+                "focus_areas": ["grammar"]
+            })
+        
+        assert "No changes" in result[0].text
+        critique_tools.db.save_chapter_version.assert_not_called()
+        mock_get_store.return_value.aadd_chapter.assert_not_called()
+    
+    async def test_revise_chapter_skips_timed_out_pass(self, critique_tools):
+        """Test a hung editor pass is skipped while the earlier pass is kept."""
+        critique_tools.llm_timeout = 0.01
+        critique_tools.db.list_chapters.return_value = [{
+            'id': 'ch-1',
+            'chapter_number': 1,
+            'status': 'draft',
+            'version': 1
+        }]
+        critique_tools.db.get_latest_chapter_content.return_value = "Teh cat sat."
+        critique_tools.grammar_editor.ret = {
+            'edited_content': "The cat sat.",
+            'changes': []
+        }
+        critique_tools.style_editor.delay = 1
+        
+        with patch('backend.mcp.tools.critique_tools.get_vector_store') as mock_get_store:
+            mock_get_store.return_value.aadd_chapter = AsyncMock()
+            result = await critique_tools.execute("revise_chapter", {
+                "project_id": "proj-1",
+                "chapter_number": 1,
+                "focus_areas": ["grammar", "style"]
+            })
+        
+        assert "Style: Skipped (timed out" in result[0].text
+        saved = critique_tools.db.save_chapter_version.call_args.kwargs
+        assert saved['content'] == "The cat sat."
@@ -3,9 +3,12 @@ Unit tests for Database operations.
 """
 
 import pytest
-import os
-import tempfile
-from backend.memory.database import Database
+import sqlite3
+import threading
+import uuid
+from backend.memory import database
+from backend.memory.database import Database, get_database
+from backend.utils.config import get_config
 
 
 class TestDatabase:
@@ -13,18 +16,13 @@ class TestDatabase:
     
     @pytest.fixture
     def temp_db(self):
-        """Create a temporary database for testing."""
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        db_path = os.path.join(temp_dir, "test.db")
-        
-        db = Database(db_path)
+        """Create a temporary in-memory database for testing."""
+        # Shared-cache URI, so other connections in this process can open it too
+        db = Database(f"file:{uuid.uuid4().hex}?mode=memory&cache=shared")
         yield db
         
-        # Cleanup
-        if os.path.exists(db_path):
-            os.remove(db_path)
-        os.rmdir(temp_dir)
+        # Closing the last connection frees the in-memory database
+        db.close()
     
     def test_database_initialization(self, temp_db):
         """Test that database initializes with correct tables."""
@@ -108,8 +106,11 @@ class TestDatabase:
     def test_list_chapters(self, temp_db):
         """Test listing chapters for a project."""
         temp_db.create_project("proj-1", "Novel 1", "fantasy")
-        temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
-        temp_db.create_chapter("ch-2", "proj-1", 2, "Chapter 2")
+        inserted = temp_db.bulk_create_chapters([
+            {"id": "ch-1", "project_id": "proj-1", "chapter_number": 1, "title": "Chapter 1"},
+            {"id": "ch-2", "project_id": "proj-1", "chapter_number": 2, "title": "Chapter 2"},
+        ])
+        assert inserted == 2
         
         chapters = temp_db.list_chapters("proj-1")
         assert len(chapters) == 2
@@ -143,13 +144,29 @@ class TestDatabase:
         temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
         
         # Save multiple versions
-        temp_db.save_chapter_version("v-1", "ch-1", 1, "Version 1", "writer")
-        temp_db.save_chapter_version("v-2", "ch-1", 2, "Version 2", "editor")
-        temp_db.save_chapter_version("v-3", "ch-1", 3, "Version 3", "writer")
+        temp_db.bulk_save_chapter_versions([
+            {"id": "v-1", "chapter_id": "ch-1", "version": 1, "content": "Version 1", "created_by": "writer"},
+            {"id": "v-2", "chapter_id": "ch-1", "version": 2, "content": "Version 2", "created_by": "editor",
+             "metadata": {"pass": "grammar"}},
+            {"id": "v-3", "chapter_id": "ch-1", "version": 3, "content": "Version 3", "created_by": "writer"},
+        ])
         
         # Should get latest
         content = temp_db.get_latest_chapter_content("ch-1")
         assert content == "Version 3"
+        assert temp_db.get_chapter_versions("ch-1")[1]['metadata'] == {"pass": "grammar"}
+    
+    def test_latest_version_number(self, temp_db):
+        """Test the latest version number comes from the saved versions."""
+        temp_db.create_project("proj-1", "Novel 1", "fantasy")
+        temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
+        assert temp_db.get_latest_version_number("ch-1") == 0
+        
+        temp_db.bulk_save_chapter_versions([
+            {"id": "v-1", "chapter_id": "ch-1", "version": 1, "content": "Version 1", "created_by": "writer"},
+            {"id": "v-2", "chapter_id": "ch-1", "version": 2, "content": "Version 2", "created_by": "editor"},
+        ])
+        assert temp_db.get_latest_version_number("ch-1") == 2
     
     def test_create_and_list_story_elements(self, temp_db):
         """Test creating and listing story elements."""
@@ -196,6 +213,67 @@ class TestDatabase:
         assert len(scores) == 1
         assert scores[0]['overall_score'] == 8.5
     
+    def test_create_chapter_returns_row(self, temp_db):
+        """Test that nested reads see rows written earlier in the same block."""
+        temp_db.create_project("proj-1", "Novel 1", "fantasy")
+        
+        chapter = temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
+        
+        assert chapter is not None
+        assert chapter['id'] == "ch-1"
+    
+    def test_connections_are_reused(self, tmp_path):
+        """Test that connections return to the pool instead of closing."""
+        db = Database(str(tmp_path / "pool.db"))
+        with db.get_connection() as first:
+            pass
+        with db.get_connection() as second:
+            pass
+        db.close()
+        
+        assert first is second
+    
+    def test_transaction_rolls_back_together(self, temp_db):
+        """Test that a failing transaction discards all of its writes."""
+        temp_db.create_project("proj-1", "Novel 1", "fantasy")
+        
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
+                temp_db.create_chapter("ch-2", "proj-1", 2, "Chapter 2")
+                raise RuntimeError("boom")
+        
+        assert temp_db.list_chapters("proj-1") == []
+    
+    def test_transaction_takes_write_lock_up_front(self, temp_db):
+        """Test that a transaction holds the write lock before its first write."""
+        with temp_db.transaction():
+            temp_db.list_projects()
+            
+            other = sqlite3.connect(temp_db.db_path, timeout=0, uri=True)
+            try:
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+            finally:
+                other.close()
+    
+    def test_memory_connection_is_held_by_one_thread(self, temp_db):
+        """Test that another thread's read waits for an open in-memory transaction."""
+        temp_db.create_project("proj-1", "Novel 1", "fantasy")
+        reader = threading.Thread(target=temp_db.list_projects)
+        
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.create_chapter("ch-1", "proj-1", 1, "Chapter 1")
+                reader.start()
+                reader.join(timeout=0.2)
+                # The reader must not commit this transaction from under us
+                assert reader.is_alive()
+                raise RuntimeError("boom")
+        
+        reader.join()
+        assert temp_db.list_chapters("proj-1") == []
+    
     def test_migration_adds_missing_columns(self, temp_db):
         """Test that migration logic adds missing columns."""
         # The migration should happen automatically on init
@@ -203,3 +281,20 @@ class TestDatabase:
         project = temp_db.create_project("proj-1", "Novel 1", "fantasy")
         assert project is not None
         assert project['id'] == "proj-1"
+        
+        with temp_db.get_connection() as conn:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(chapter_versions)")}
+        assert {"agent_name", "model"} <= columns
+    
+    def test_get_database_is_shared(self, tmp_path):
+        """Test that get_database returns one instance per path."""
+        path = str(tmp_path / "shared.db")
+        db = get_database(path)
+        
+        try:
+            assert get_database(path) is db
+            # A defaulted pool size resolves to the same shared instance
+            assert get_database(path, get_config().database.pool_size) is db
+            assert get_database(str(tmp_path / "other.db")) is not db
+        finally:
+            database._shared_database.cache_clear()
@@ -0,0 +1,40 @@
+"""
+Unit tests for the Ollama client.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from backend.llm.ollama_client import OllamaClient
+
+
+class TestOllamaClient:
+    """Test suite for OllamaClient class."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create a client whose session can't be opened."""
+        client = OllamaClient()
+        client._get_session = AsyncMock(side_effect=ConnectionError("offline"))
+        return client
+    
+    async def test_health_check_skips_request_when_recently_ok(self, client):
+        """Test that a recent successful response short-circuits the health check."""
+        client._mark_ok()
+        
+        assert await client.health_check() is True
+        client._get_session.assert_not_called()
+    
+    async def test_health_check_requests_when_stale(self, client):
+        """Test that the server is queried once the cached result has expired."""
+        client._mark_ok()
+        client.health_ttl = 0
+        
+        assert await client.health_check() is False
+        client._get_session.assert_awaited_once()
+    
+    def test_retry_budget_covers_every_attempt(self):
+        """Test the retry budget spans all attempts plus the backoff sleeps."""
+        client = OllamaClient(timeout=10, max_retries=3)
+        
+        # 3 attempts of 10s, with 1s and 2s sleeps between them
+        assert client.retry_budget == 33
@@ -3,20 +3,44 @@ Unit tests for MCP Outline Tools.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
-from backend.mcp.tools.outline_tools import OutlineTools
+from types import MappingProxyType
+from unittest.mock import Mock
+from backend.utils import background
+
+
+# Read-only project rows shared across tests
+_PROJECT_NO_VISION = MappingProxyType({
+    'id': 'proj-1',
+    'title': 'Test Novel',
+    'genre': 'sci-fi',
+    'description': 'A test novel',
+    'target_chapters': 20
+})
+_PROJECT_WITH_VISION = MappingProxyType({
+    'id': 'proj-1',
+    'title': 'Test Novel',
+    'genre': 'sci-fi',
+    'vision_document': 'A great vision',
+    'target_chapters': 20
+})
+
+# Database methods these tests use; spec_set rejects anything else
+_DB_METHODS = ["get_project", "update_project"]
 
 
 class TestOutlineTools:
     """Test suite for OutlineTools class."""
     
     @pytest.fixture
-    def outline_tools(self):
-        """Create OutlineTools instance with mocked dependencies."""
-        tools = OutlineTools()
-        tools.db = Mock()
-        tools.director = AsyncMock()
-        tools.outline_agent = AsyncMock()
+    def outline_tools(self, shared_outline_tools, stub_agent):
+        """Wire fresh mocks onto the shared OutlineTools instance."""
+        tools = shared_outline_tools
+        tools.db = Mock(spec_set=_DB_METHODS)
+        # Defaults for tests that don't care about the agents' output
+        tools.director = stub_agent(ret={'vision_document': 'Generated vision'})
+        tools.outline_agent = stub_agent(ret={'outline': 'Chapter 1: Introduction'})
+        tools.git = Mock()
+        tools.commit_outlines = True
         return tools
     
     def test_get_tools_returns_one_tool(self, outline_tools):
@@ -26,17 +50,10 @@ class TestOutlineTools:
         assert len(tools) == 1
         assert tools[0].name == "generate_outline"
     
-    @pytest.mark.asyncio
     async def test_generate_outline_success(self, outline_tools):
         """Test successful outline generation."""
-        outline_tools.db.get_project.return_value = {
-            'id': 'proj-1',
-            'title': 'Test Novel',
-            'genre': 'sci-fi',
-            'vision_document': 'A great vision',
-            'target_chapters': 20
-        }
-        outline_tools.outline_agent.execute.return_value = {
+        outline_tools.db.get_project.return_value = _PROJECT_WITH_VISION
+        outline_tools.outline_agent.ret = {
             'outline': 'Chapter 1: Introduction\nChapter 2: Rising Action'
         }
         
@@ -47,35 +64,27 @@ class TestOutlineTools:
         
         assert len(result) == 1
         assert "outline" in result[0].text.lower() or "Outline" in result[0].text
-        assert outline_tools.outline_agent.execute.called
+        assert outline_tools.outline_agent.calls == 1
         assert outline_tools.db.update_project.called
+        
+        await background.drain()
+        outline_tools.git.save_outline.assert_called_once_with(
+            project_id='proj-1',
+            outline_content='Chapter 1: Introduction\nChapter 2: Rising Action'
+        )
     
-    @pytest.mark.asyncio
     async def test_generate_outline_without_vision(self, outline_tools):
         """Test outline generation when vision doesn't exist."""
-        outline_tools.db.get_project.return_value = {
-            'id': 'proj-1',
-            'title': 'Test Novel',
-            'genre': 'sci-fi',
-            'description': 'A test novel',
-            'target_chapters': 20
-        }
-        outline_tools.director.execute.return_value = {
-            'vision_document': 'Generated vision'
-        }
-        outline_tools.outline_agent.execute.return_value = {
-            'outline': 'Chapter 1: Introduction'
-        }
+        outline_tools.db.get_project.return_value = _PROJECT_NO_VISION
         
         result = await outline_tools.execute("generate_outline", {
             "project_id": "proj-1"
         })
         
         assert len(result) == 1
-        assert outline_tools.director.execute.called
-        assert outline_tools.outline_agent.execute.called
+        assert outline_tools.director.calls == 1
+        assert outline_tools.outline_agent.calls == 1
     
-    @pytest.mark.asyncio
     async def test_generate_outline_project_not_found(self, outline_tools):
         """Test outline generation for non-existent project."""
         outline_tools.db.get_project.return_value = None
@@ -86,9 +95,3 @@ class TestOutlineTools:
         
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
-    
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, outline_tools):
-        """Test executing unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await outline_tools.execute("nonexistent_tool", {})
@@ -3,19 +3,67 @@ Unit tests for MCP Project Tools.
 """
 
 import pytest
-import uuid
-from unittest.mock import Mock, patch, MagicMock
-from backend.mcp.tools.project_tools import ProjectTools
+from typing import Any, Dict, NamedTuple
+from unittest.mock import create_autospec
+
+
+class Case(NamedTuple):
+    """One project tool call: canned db returns and the text it should produce."""
+    tool: str
+    args: Dict[str, Any]
+    db_returns: Dict[str, Any]
+    expected: tuple[str, ...]
+
+
+NEW_BOOK = {"id": "proj-123", "title": "New Book", "genre": "romance", "status": "planning", "target_chapters": 30}
+SIMPLE_BOOK = {"id": "proj-456", "title": "Simple Book", "genre": "fantasy", "status": "planning"}
+
+CASES = {
+    "list_projects_success": Case(
+        "list_projects",
+        {"limit": 10},
+        {"list_projects": [
+            {"id": "proj-1", "title": "Test Book", "genre": "fantasy", "status": "planning", "target_chapters": 20},
+            {"id": "proj-2", "title": "Another Book", "genre": "sci-fi", "status": "outlined", "target_chapters": 15},
+        ]},
+        ("Test Book", "Another Book", "fantasy"),
+    ),
+    "list_projects_empty": Case(
+        "list_projects",
+        {"limit": 10},
+        {"list_projects": []},
+        ("No projects found",),
+    ),
+    "get_project_info_not_found": Case(
+        "get_project_info",
+        {"project_id": "nonexistent"},
+        {"get_project": None},
+        ("not found",),
+    ),
+    "create_project_success": Case(
+        "create_project",
+        {"title": "New Book", "genre": "romance", "description": "A love story", "target_chapters": 30},
+        {"create_project": NEW_BOOK, "get_project": NEW_BOOK},
+        ("Created project", "New Book"),
+    ),
+    "create_project_minimal_args": Case(
+        "create_project",
+        {"title": "Simple Book", "genre": "fantasy"},
+        {"create_project": SIMPLE_BOOK, "get_project": {**SIMPLE_BOOK, "target_chapters": 20}},
+        ("Simple Book",),
+    ),
+}
 
 
 class TestProjectTools:
     """Test suite for ProjectTools class."""
     
     @pytest.fixture
-    def project_tools(self):
-        """Create ProjectTools instance with mocked database."""
-        tools = ProjectTools()
-        tools.db = Mock()
+    def project_tools(self, shared_project_tools):
+        """Wire a fresh autospecced database onto the shared ProjectTools instance."""
+        from backend.memory.database import Database
+        tools = shared_project_tools
+        tools.db = create_autospec(Database, instance=True)
         return tools
     
     def test_get_tools_returns_three_tools(self, project_tools):
@@ -28,34 +76,17 @@ class TestProjectTools:
         assert "get_project_info" in tool_names
         assert "create_project" in tool_names
     
-    @pytest.mark.asyncio
-    async def test_list_projects_success(self, project_tools):
-        """Test listing projects successfully."""
-        # Mock database response
-        project_tools.db.list_projects.return_value = [
-            {"id": "proj-1", "title": "Test Book", "genre": "fantasy", "status": "planning", "target_chapters": 20},
-            {"id": "proj-2", "title": "Another Book", "genre": "sci-fi", "status": "outlined", "target_chapters": 15},
-        ]
-        
-        result = await project_tools.execute("list_projects", {"limit": 10})
-        
-        assert len(result) == 1
-        assert "Test Book" in result[0].text
-        assert "Another Book" in result[0].text
-        assert "fantasy" in result[0].text
-        project_tools.db.list_projects.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_list_projects_empty(self, project_tools):
-        """Test listing projects when none exist."""
-        project_tools.db.list_projects.return_value = []
-        
-        result = await project_tools.execute("list_projects", {"limit": 10})
+    @pytest.mark.parametrize("case", CASES.values(), ids=CASES.keys())
+    async def test_project_tool(self, project_tools, run_tool, case):
+        """Test each tool renders the expected text from the database response."""
+        result = await run_tool(project_tools, case.tool, case.args, case.db_returns)
         
         assert len(result) == 1
-        assert "No projects found" in result[0].text
+        for text in case.expected:
+            assert text in result[0].text
+        for method in case.db_returns:
+            getattr(project_tools.db, method).assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_list_projects_with_limit(self, project_tools):
         """Test listing projects with limit applied."""
         projects = [{"id": f"proj-{i}", "title": f"Book {i}", "genre": "fantasy", "status": "planning"} 
@@ -69,7 +100,6 @@ class TestProjectTools:
         project_lines = [l for l in lines if l.startswith('- ')]
         assert len(project_lines) == 5
     
-    @pytest.mark.asyncio
     async def test_get_project_info_success(self, project_tools):
         """Test getting project info successfully."""
         project_tools.db.get_project.return_value = {
@@ -91,71 +121,6 @@ class TestProjectTools:
         assert "writing" in result[0].text
         project_tools.db.get_project.assert_called_once_with("proj-1")
     
-    @pytest.mark.asyncio
-    async def test_get_project_info_not_found(self, project_tools):
-        """Test getting project info when project doesn't exist."""
-        project_tools.db.get_project.return_value = None
-        
-        result = await project_tools.execute("get_project_info", {"project_id": "nonexistent"})
-        
-        assert len(result) == 1
-        assert "not found" in result[0].text.lower()
-    
-    @pytest.mark.asyncio
-    async def test_create_project_success(self, project_tools):
-        """Test creating a project successfully."""
-        mock_project = {
-            "id": "proj-123",
-            "title": "New Book",
-            "genre": "romance",
-            "status": "planning",
-            "target_chapters": 30
-        }
-        
-        project_tools.db.create_project.return_value = mock_project
-        project_tools.db.get_project.return_value = {**mock_project, "target_chapters": 30}
-        
-        result = await project_tools.execute("create_project", {
-            "title": "New Book",
-            "genre": "romance",
-            "description": "A love story",
-            "target_chapters": 30
-        })
-        
-        assert len(result) == 1
-        assert "Created project" in result[0].text or "✅" in result[0].text
-        assert "New Book" in result[0].text
-        assert project_tools.db.create_project.called
-    
-    @pytest.mark.asyncio
-    async def test_create_project_minimal_args(self, project_tools):
-        """Test creating a project with minimal arguments."""
-        mock_project = {
-            "id": "proj-456",
-            "title": "Simple Book",
-            "genre": "fantasy",
-            "status": "planning",
-        }
-        
-        project_tools.db.create_project.return_value = mock_project
-        project_tools.db.get_project.return_value = {**mock_project, "target_chapters": 20}
-        
-        result = await project_tools.execute("create_project", {
-            "title": "Simple Book",
-            "genre": "fantasy"
-        })
-        
-        assert len(result) == 1
-        assert "Simple Book" in result[0].text
-        assert project_tools.db.create_project.called
-    
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, project_tools):
-        """Test executing an unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await project_tools.execute("nonexistent_tool", {})
-    
-    @pytest.mark.asyncio
     async def test_error_handling(self, project_tools):
         """Test that errors are properly propagated."""
         project_tools.db.list_projects.side_effect = Exception("Database error")
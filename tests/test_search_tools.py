@@ -4,16 +4,32 @@ Unit tests for MCP Search Tools.
 
 import pytest
 from unittest.mock import Mock, patch
-from backend.mcp.tools.search_tools import SearchTools
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_get_vector_store():
+    """Patch the vector store lookup once for the whole module."""
+    with patch('backend.mcp.tools.search_tools.get_vector_store') as mock_get_store:
+        yield mock_get_store
+
+
+@pytest.fixture
+def vector_store(mock_get_vector_store):
+    """Give each test a fresh vector store mock with empty search results."""
+    store = Mock()
+    store.search_chapters.return_value = []
+    store.search_story_bible.return_value = []
+    mock_get_vector_store.return_value = store
+    return store
 
 
 class TestSearchTools:
     """Test suite for SearchTools class."""
     
     @pytest.fixture
-    def search_tools(self):
-        """Create SearchTools instance."""
-        return SearchTools()
+    def search_tools(self, shared_search_tools, vector_store):
+        """Pair the shared SearchTools instance with a fresh vector store mock."""
+        return shared_search_tools
     
     def test_get_tools_returns_one_tool(self, search_tools):
         """Test that get_tools returns 1 tool definition."""
@@ -22,27 +38,31 @@ class TestSearchTools:
         assert len(tools) == 1
         assert tools[0].name == "search_context"
     
-    @pytest.mark.asyncio
-    async def test_search_context_no_results(self, search_tools):
+    async def test_search_context_no_results(self, search_tools, vector_store):
         """Test search with no results."""
-        with patch('backend.mcp.tools.search_tools.VectorStore') as mock_vector_store:
-            mock_instance = Mock()
-            mock_instance.search_chapters.return_value = []
-            mock_instance.search_story_bible.return_value = []
-            mock_vector_store.return_value = mock_instance
-            
-            result = await search_tools.execute("search_context", {
-                "project_id": "proj-1",
-                "query": "nonexistent",
-                "search_type": "both",
-                "limit": 5
-            })
-            
-            assert len(result) == 1
-            assert "no results" in result[0].text.lower() or "search results" in result[0].text.lower()
+        result = await search_tools.execute("search_context", {
+            "project_id": "proj-1",
+            "query": "nonexistent",
+            "search_type": "both",
+            "limit": 5
+        })
+        
+        assert len(result) == 1
+        text = result[0].text.lower()
+        assert "no results" in text or "search results" in text
     
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, search_tools):
-        """Test executing unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await search_tools.execute("nonexistent_tool", {})
+    async def test_search_context_chapter_results(self, search_tools, vector_store):
+        """Test chapter hits are listed with their excerpts."""
+        vector_store.search_chapters.return_value = [
+            {"chapter_number": 3, "title": "The Storm", "content": "Rain lashed the deck."}
+        ]
+        
+        result = await search_tools.execute("search_context", {
+            "project_id": "proj-1",
+            "query": "storm",
+            "search_type": "chapters"
+        })
+        
+        assert "Chapter 3: The Storm" in result[0].text
+        assert "Rain lashed the deck." in result[0].text
+        vector_store.search_story_bible.assert_not_called()
@@ -4,17 +4,20 @@ Unit tests for MCP Story Bible Tools.
 
 import pytest
 from unittest.mock import Mock, AsyncMock
-from backend.mcp.tools.story_bible_tools import StoryBibleTools
+
+
+# Database methods these tests use; spec_set rejects anything else
+_DB_METHODS = ["get_project", "get_story_bible", "create_story_element"]
 
 
 class TestStoryBibleTools:
     """Test suite for StoryBibleTools class."""
     
     @pytest.fixture
-    def story_bible_tools(self):
-        """Create StoryBibleTools instance with mocked dependencies."""
-        tools = StoryBibleTools()
-        tools.db = Mock()
+    def story_bible_tools(self, shared_story_bible_tools):
+        """Wire fresh mocks onto the shared StoryBibleTools instance."""
+        tools = shared_story_bible_tools
+        tools.db = Mock(spec_set=_DB_METHODS)
         tools.vector_store = Mock()
         return tools
     
@@ -27,10 +30,9 @@ class TestStoryBibleTools:
         assert "get_story_bible" in tool_names
         assert "add_story_element" in tool_names
     
-    @pytest.mark.asyncio
-    async def test_get_story_bible_success(self, story_bible_tools):
+    async def test_get_story_bible_success(self, story_bible_tools, run_tool):
         """Test successful story bible retrieval."""
-        story_bible_tools.db.get_story_bible.return_value = {
+        bible = {
             'characters': [
                 {
                     'name': 'John Doe',
@@ -45,38 +47,29 @@ class TestStoryBibleTools:
             ]
         }
         
-        result = await story_bible_tools.execute("get_story_bible", {
-            "project_id": "proj-1"
-        })
+        result = await run_tool(story_bible_tools, "get_story_bible", {"project_id": "proj-1"},
+                                {"get_story_bible": bible})
         
         assert len(result) == 1
         assert "John Doe" in result[0].text or "character" in result[0].text.lower()
     
-    @pytest.mark.asyncio
-    async def test_get_story_bible_empty(self, story_bible_tools):
+    async def test_get_story_bible_empty(self, story_bible_tools, run_tool):
         """Test story bible retrieval with no elements."""
-        story_bible_tools.db.get_story_bible.return_value = None
-        
-        result = await story_bible_tools.execute("get_story_bible", {
-            "project_id": "proj-1"
-        })
+        result = await run_tool(story_bible_tools, "get_story_bible", {"project_id": "proj-1"},
+                                {"get_story_bible": None})
         
         assert len(result) == 1
-        assert "no" in result[0].text.lower() or "story bible" in result[0].text.lower()
+        text = result[0].text.lower()
+        assert "no" in text or "story bible" in text
     
-    @pytest.mark.asyncio
-    async def test_get_story_bible_project_not_found(self, story_bible_tools):
+    async def test_get_story_bible_project_not_found(self, story_bible_tools, run_tool):
         """Test story bible retrieval for project with empty bible."""
-        story_bible_tools.db.get_story_bible.return_value = {}
-        
-        result = await story_bible_tools.execute("get_story_bible", {
-            "project_id": "proj-1"
-        })
+        result = await run_tool(story_bible_tools, "get_story_bible", {"project_id": "proj-1"},
+                                {"get_story_bible": {}})
         
         assert len(result) == 1
         # Should return some result (even if empty)
     
-    @pytest.mark.asyncio
     async def test_add_story_element_success(self, story_bible_tools):
         """Test successful story element addition."""
         story_bible_tools.db.get_project.return_value = {
@@ -102,23 +95,14 @@ class TestStoryBibleTools:
         assert "Jane Doe" in result[0].text
         assert story_bible_tools.db.create_story_element.called
     
-    @pytest.mark.asyncio
-    async def test_add_story_element_project_not_found(self, story_bible_tools):
+    async def test_add_story_element_project_not_found(self, story_bible_tools, run_tool):
         """Test adding element to non-existent project."""
-        story_bible_tools.db.get_project.return_value = None
-        
-        result = await story_bible_tools.execute("add_story_element", {
+        result = await run_tool(story_bible_tools, "add_story_element", {
             "project_id": "proj-1",
             "element_type": "character",
             "name": "Jane Doe",
             "description": "Supporting character"
-        })
+        }, {"get_project": None})
         
         assert len(result) == 1
         assert "not found" in result[0].text.lower()
-    
-    @pytest.mark.asyncio
-    async def test_execute_unknown_tool(self, story_bible_tools):
-        """Test executing unknown tool raises error."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            await story_bible_tools.execute("nonexistent_tool", {})
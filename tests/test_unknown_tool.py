@@ -0,0 +1,24 @@
+"""
+Unit tests for unknown tool names across all MCP tool handlers.
+"""
+
+import importlib
+import pytest
+
+
+@pytest.mark.parametrize("module_name, class_name", [
+    ("chapter_tools", "ChapterTools"),
+    ("critique_tools", "CritiqueTools"),
+    ("outline_tools", "OutlineTools"),
+    ("project_tools", "ProjectTools"),
+    ("search_tools", "SearchTools"),
+    ("story_bible_tools", "StoryBibleTools"),
+])
+async def test_execute_unknown_tool(module_name, class_name):
+    """Test executing an unknown tool raises error."""
+    # Imported here so collection doesn't load the tool modules
+    module = importlib.import_module(f"backend.mcp.tools.{module_name}")
+    tool = getattr(module, class_name)()
+    
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await tool.execute("nonexistent_tool", {})